@@ -4,14 +4,21 @@ MPX AppPort EA Portfolio — FastAPI + SQLite Backend
 Requirements:  pip install fastapi uvicorn
 
 Run:
-  python server.py
+  python server.py                (DEV_RELOAD=1 → auto-reload, WORKERS=N → multi-process)
   หรือ: uvicorn server:app --reload --port 8000
 
 Endpoints:
   GET  /                           -> Frontend (static/index.html)
   GET  /api/version                -> App version info
   GET  /api/stats                  -> Dashboard KPIs
-  GET  /api/apps                   -> List apps (filters: status, domain, bcg, ea_group, search, show_decomm)
+  GET  /api/apps                   -> List apps (filters: status, domain, bcg, ea_group, search, show_decomm,
+                                      eol_from/eol_before, contract_end_from/contract_end_before,
+                                      tech, owner, stream, ea_category, capability, wave, dr, pi_spi, src_avail,
+                                      {health,tco,age,tech_debt,risk,score}_{min,max}; fields=col,col,… to project;
+                                      offset/limit to page)
+  GET  /api/apps/summary           -> Pre-aggregated counts (bcg/status/wave/ea_group/domain/stream), TCO by domain/stream, avg health by domain,
+                                      health histogram
+  GET  /api/apps/distinct/{col}    -> Sorted distinct values of a categorical column (status, vendor, stream, …)
   GET  /api/apps/{id}              -> Get single app
   POST /api/apps                   -> Create app
   PUT  /api/apps/{id}              -> Update app
@@ -21,24 +28,40 @@ Endpoints:
 """
 
 from __future__ import annotations
-import json, os, sqlite3, uuid, time
-import hmac, hashlib, base64, secrets
+import gzip, json, os, re, sqlite3, sys, uuid, time, queue, functools
+import hmac, hashlib, base64, secrets, urllib.parse, email.utils
 try:
     import requests as _requests_lib
     _NVD_AVAILABLE = True
 except ImportError:
     _requests_lib = None
     _NVD_AVAILABLE = False
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, namedtuple
 from contextlib import contextmanager
+from decimal import Decimal, ROUND_HALF_UP
+from itertools import compress
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import List, Optional, Any
 
 try:
     from fastapi import FastAPI, HTTPException, Request, Depends
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import FileResponse, JSONResponse
+    from fastapi.middleware.gzip import GZipMiddleware
+    from fastapi.responses import JSONResponse, Response
     from fastapi.staticfiles import StaticFiles
-    from pydantic import BaseModel
+    from pydantic import BaseModel, ConfigDict
+    from starlette.concurrency import run_in_threadpool
     try:
         from starlette.middleware.base import BaseHTTPMiddleware
     except ImportError:
@@ -53,7 +76,16 @@ except ImportError:
 # ─── CONFIG — อ่านจาก mpx-studio.config.json ─────────────────────────────────
 _CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mpx-studio.config.json")
 
+_CFG_CACHE: Optional[tuple] = None   # (st_mtime_ns, config dict) — re-read only when the file changes
+
 def _load_config() -> dict:
+    global _CFG_CACHE
+    try:
+        mtime = os.stat(_CONFIG_PATH).st_mtime_ns
+    except OSError:
+        mtime = 0
+    if _CFG_CACHE and _CFG_CACHE[0] == mtime:
+        return _CFG_CACHE[1]
     defaults = {
         "version":      "V001",
         "app_name":     "MPX AppPort",
@@ -70,6 +102,7 @@ def _load_config() -> dict:
             print(f"⚠️  Cannot read config: {e} — using defaults")
     else:
         print(f"ℹ️  mpx-studio.config.json not found — using defaults")
+    _CFG_CACHE = (mtime, defaults)
     return defaults
 
 CFG          = _load_config()
@@ -79,10 +112,12 @@ APP_SUBTITLE = CFG.get("subtitle", "EA PORTFOLIO")
 
 _BASE          = os.path.dirname(os.path.abspath(__file__))
 DB_PATH        = os.path.join(_BASE, "appport.db")
+DB_ABS_PATH    = os.path.abspath(DB_PATH)   # resolved once — connection openers never touch the filesystem for it
 AUDIT_DB_PATH  = os.path.join(_BASE, "appport_audit.db")
 VENDOR_DB_PATH = os.path.join(_BASE, "vendor.db")
 ESA_DB_PATH        = os.path.join(_BASE, "esa.db")
 EA_DOMAINS_DB_PATH = os.path.join(_BASE, "ea_domains.db")
+SEED_APPS_PATH     = os.path.join(_BASE, "seed_apps.json")
 PORT               = int(os.environ.get("PORT", 8000))   # Railway injects $PORT automatically
 STATIC_DIR     = os.path.join(_BASE, "static")
 
@@ -126,7 +161,7 @@ def _blacklist_token(token: str) -> None:
                 _, b, _ = t.split(".")
                 pad = 4 - len(b) % 4
                 if pad != 4: b += "=" * pad
-                payload = json.loads(base64.urlsafe_b64decode(b))
+                payload = _json_loads(base64.urlsafe_b64decode(b))
                 if payload.get("exp", 0) < now:
                     stale.add(t)
             except Exception:
@@ -197,7 +232,7 @@ def _validate_password_strength(password: str) -> None:
 def _create_jwt(payload: dict) -> str:
     secret = (_UCFG or {}).get("jwt_secret", _DEFAULT_JWT_SECRET)
     header  = _b64url_enc(b'{"alg":"HS256","typ":"JWT"}')
-    body_b  = _b64url_enc(json.dumps(payload).encode())
+    body_b  = _b64url_enc(_json_dumps(payload))
     sig     = _b64url_enc(hmac.new(secret.encode(), f"{header}.{body_b}".encode(), hashlib.sha256).digest())
     return f"{header}.{body_b}.{sig}"
 
@@ -210,17 +245,31 @@ def _verify_jwt(token: str) -> Optional[dict]:
         h, b, s = token.split(".")
         expected = _b64url_enc(hmac.new(secret.encode(), f"{h}.{b}".encode(), hashlib.sha256).digest())
         if not hmac.compare_digest(s, expected): return None
-        payload = json.loads(_b64url_dec(b))
+        payload = _json_loads(_b64url_dec(b))
         if payload.get("exp", 0) < datetime.now().timestamp(): return None
         return payload
     except Exception:
         return None
 
 # ─── FASTAPI ───────────────────────────────────────────────────────────────────
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _json_dumps(obj) -> bytes:
+    """Compact UTF-8 JSON bytes — orjson when installed, stdlib otherwise. int/float/bool/None dict keys
+    become strings either way, as stdlib json does."""
+    if orjson is not None: return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+class _JSONResponse(JSONResponse):
+    """Default response class — dict/list bodies go through _json_dumps instead of stdlib json.dumps."""
+    def render(self, content) -> bytes:
+        return _json_dumps(content)
+
 app = FastAPI(
     title       = f"MPX AppPort EA Portfolio {APP_VERSION}",
     description = "Enterprise Application Portfolio Management — REST API",
     version     = APP_VERSION,
+    default_response_class = _JSONResponse,
 )
 _ALLOWED_ORIGINS = os.environ.get("ALLOWED_ORIGINS", "http://localhost:8000").split(",")
 app.add_middleware(
@@ -229,6 +278,39 @@ app.add_middleware(
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["Content-Type", "Authorization"],
 )
+def _negotiate_coding(accept: str, offered) -> Optional[str]:
+    """Content-coding to send from `offered` (server preference order), or None for identity.
+    Accept-Encoding is read as RFC 9110 §12.5.3 tokens: q=0 refuses a coding, '*' covers unlisted codings,
+    and an identity listed with a higher q than every offered coding wins."""
+    q: dict = {}
+    for part in accept.split(","):
+        name, *params = part.split(";")
+        name, w = name.strip().lower(), 1.0
+        if not name: continue
+        for p in params:
+            k, _, v = p.partition("=")
+            if k.strip().lower() == "q":
+                try:    w = float(v)
+                except ValueError: w = 0.0
+        q[name] = w
+    weight = lambda c: q.get(c, q.get("*", 0.0))
+    best = max(offered, key=weight, default=None)   # ties → first in server preference order
+    if best is None or weight(best) <= 0 or q.get("identity", 0.0) > weight(best):
+        return None
+    return best
+
+class _GZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that honours Accept-Encoding q-values (stock one substring-matches "gzip", so
+    'gzip;q=0' would still get gzip)."""
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            accept = dict(scope["headers"]).get(b"accept-encoding", b"").decode("latin-1")
+            if _negotiate_coding(accept, ("gzip",)) is None:
+                return await self.app(scope, receive, send)
+        await super().__call__(scope, receive, send)
+
+# index.html และ catalog bodies ส่งแบบ pre-encoded (middleware ข้ามให้) — ที่เหลือบีบต่อ request จึงใช้ level 6 ไม่ใช่ 9
+app.add_middleware(_GZipMiddleware, minimum_size=1024, compresslevel=6)
 # NOTE: OperationLogMiddleware is added after init_audit_db() at the bottom of this file
 
 # ─── AUDIT DATABASE ────────────────────────────────────────────────────────────
@@ -254,11 +336,25 @@ CREATE TABLE IF NOT EXISTS audit_log (
 
 AUDIT_RETENTION = {"AUDIT": 3*365, "COMPLIANCE": 5*365, "OPERATION": 90}  # days
 
+# audit/vendor/esa/ea_domains เปิด connection ใหม่ทุกครั้ง — WAL + synchronous=NORMAL ให้ commit ไม่ fsync ทุกครั้ง
+# (audit_log ถูกเขียนแทบทุก request) ยังคงทนต่อ crash ของ process; busy_timeout กัน "database is locked"
+_SIDE_DB_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA busy_timeout=5000;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=67108864;
+"""
+
+def _open_side_db(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SIDE_DB_PRAGMAS)
+    return conn
+
 @contextmanager
 def get_audit_db():
-    conn = sqlite3.connect(AUDIT_DB_PATH)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn = _open_side_db(AUDIT_DB_PATH)
     try:
         yield conn; conn.commit()
     except Exception:
@@ -354,9 +450,7 @@ CREATE INDEX IF NOT EXISTS idx_veng_app    ON vendor_engagements(app_id);
 
 @contextmanager
 def get_vendor_db():
-    conn = sqlite3.connect(VENDOR_DB_PATH)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn = _open_side_db(VENDOR_DB_PATH)
     try:
         yield conn; conn.commit()
     except Exception:
@@ -1794,9 +1888,7 @@ _ESA_SEED_SBB = [
 
 @contextmanager
 def get_esa_db():
-    conn = sqlite3.connect(ESA_DB_PATH)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn = _open_side_db(ESA_DB_PATH)
     try:
         yield conn; conn.commit()
     except Exception:
@@ -1865,9 +1957,7 @@ def init_esa_db():
 # ─── EA DOMAINS DB ─────────────────────────────────────────────────────────────
 @contextmanager
 def get_ea_domains_db():
-    conn = sqlite3.connect(EA_DOMAINS_DB_PATH)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn = _open_side_db(EA_DOMAINS_DB_PATH)
     try:
         yield conn; conn.commit()
     except Exception:
@@ -2348,7 +2438,7 @@ def get_connected_db():
 def _vrow(row) -> dict:
     d = dict(row)
     for f in ("specializations","certifications"):
-        try: d[f] = json.loads(d.get(f) or "[]")
+        try: d[f] = _json_loads(d.get(f) or "[]")
         except: d[f] = []
     for f in ("nda_signed",):
         if f in d: d[f] = bool(d[f])
@@ -2627,7 +2717,9 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
         path = request.url.path
         if not any(path.startswith(p) for p in self.SKIP_PREFIXES) and path.startswith("/api/"):
             sev = "ERROR" if response.status_code >= 500 else ("WARNING" if response.status_code >= 400 else "INFO")
-            write_log(
+            # write_log เป็น sqlite แบบ sync — ส่งไป threadpool ไม่ให้ block event loop
+            await run_in_threadpool(
+                write_log,
                 category="OPERATION",
                 event_type=f"{request.method} {path}",
                 severity=sev,
@@ -2639,17 +2731,101 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
         return response
 
 # ─── DATABASE ──────────────────────────────────────────────────────────────────
-@contextmanager
-def get_db():
-    conn = sqlite3.connect(DB_PATH)
+# journal_mode is persisted in the DB file → set once per process; the rest are per-connection
+_WAL_SET = False
+# pooled connections live for the whole process — a bigger prepared-statement cache (default 128) keeps
+# every route's SQL compiled once per connection instead of re-preparing after eviction
+_DB_CACHED_STATEMENTS = 256
+_DB_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA busy_timeout=5000;
+PRAGMA cache_size=-20000;
+PRAGMA temp_store=MEMORY;
+PRAGMA foreign_keys=ON;
+PRAGMA mmap_size=268435456;
+PRAGMA wal_autocheckpoint=1000;
+"""
+
+def _open_db() -> sqlite3.Connection:
+    global _WAL_SET
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=_DB_CACHED_STATEMENTS)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    if not _WAL_SET:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _WAL_SET = True
+    conn.executescript(_DB_PRAGMAS)
+    return conn
+
+_DB_RO_URI = f"file:{urllib.parse.quote(DB_ABS_PATH)}?mode=ro"
+
+def _open_db_ro() -> sqlite3.Connection:
+    """Read-only appport.db connection for GET routes — query_only + a 1 GiB mmap window."""
+    conn = sqlite3.connect(_DB_RO_URI, uri=True, check_same_thread=False, cached_statements=_DB_CACHED_STATEMENTS)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_DB_PRAGMAS + "PRAGMA query_only=1; PRAGMA mmap_size=1073741824; PRAGMA cache_size=-65536;")
+    return conn
+
+class _ConnectionPool:
+    """Long-lived appport.db connections reused across requests (page cache stays warm,
+    PRAGMAs applied once). Connections are opened lazily up to `size`; when the pool is
+    exhausted an `overflow` pool hands out a throw-away connection instead of blocking,
+    otherwise the caller waits — a size-1 blocking pool serializes writers."""
+
+    def __init__(self, size: int, overflow: bool = True, opener=_open_db):
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._size, self._overflow, self._open = size, overflow, opener
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> tuple[sqlite3.Connection, bool]:
+        """Return (conn, pooled). Non-pooled connections must be closed by the caller."""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            pass
+        with self._lock:
+            grow = self._opened < self._size
+            if grow: self._opened += 1
+        if grow:
+            try:
+                return self._open(), True
+            except Exception:
+                with self._lock: self._opened -= 1
+                raise
+        if self._overflow:
+            return self._open(), False
+        return self._idle.get(), True
+
+    def release(self, conn: sqlite3.Connection, pooled: bool) -> None:
+        if pooled: self._idle.put(conn)
+        else:      conn.close()
+
+_DB_POOL_SIZE  = int(os.environ.get("DB_POOL_SIZE", os.cpu_count() or 4))   # WAL: N readers, 1 writer
+_DB_POOL       = _ConnectionPool(_DB_POOL_SIZE)           # readers + misc. routes
+_DB_WRITE_POOL = _ConnectionPool(1, overflow=False)       # app catalog writers (serialized)
+_DB_RO_POOL    = _ConnectionPool(_DB_POOL_SIZE, opener=_open_db_ro)   # read-only app catalog GETs
+
+@contextmanager
+def get_db(write: bool = False):
+    """Borrow a pooled appport.db connection; commit on success, rollback on error.
+    write=True routes through the single-connection writer pool (POST/PUT/import)."""
+    pool = _DB_WRITE_POOL if write else _DB_POOL
+    conn, pooled = pool.acquire()
     try:
         yield conn; conn.commit()
     except Exception:
         conn.rollback(); raise
     finally:
-        conn.close()
+        pool.release(conn, pooled)
+
+@contextmanager
+def get_db_ro():
+    """Borrow a read-only appport.db connection (no commit/rollback — nothing to write)."""
+    conn, pooled = _DB_RO_POOL.acquire()
+    try:
+        yield conn
+    finally:
+        _DB_RO_POOL.release(conn, pooled)
 
 DDL = """
 CREATE TABLE IF NOT EXISTS roadmap_items (
@@ -2689,6 +2865,21 @@ CREATE TABLE IF NOT EXISTS applications (
     last_updated TEXT
 );
 CREATE TABLE IF NOT EXISTS config (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS app_counter (id INTEGER PRIMARY KEY CHECK(id=1), seq INTEGER NOT NULL);
+-- bumped by trigger on every applications write → in-memory catalog snapshot knows when to rebuild
+CREATE TABLE IF NOT EXISTS app_catalog_version (id INTEGER PRIMARY KEY CHECK(id=1), version INTEGER NOT NULL);
+INSERT OR IGNORE INTO app_catalog_version VALUES (1, 0);
+CREATE TRIGGER IF NOT EXISTS applications_ver_ai AFTER INSERT ON applications BEGIN
+    UPDATE app_catalog_version SET version = version + 1 WHERE id=1; END;
+CREATE TRIGGER IF NOT EXISTS applications_ver_ad AFTER DELETE ON applications BEGIN
+    UPDATE app_catalog_version SET version = version + 1 WHERE id=1; END;
+CREATE TRIGGER IF NOT EXISTS applications_ver_au AFTER UPDATE ON applications BEGIN
+    UPDATE app_catalog_version SET version = version + 1 WHERE id=1; END;
+-- เวลาที่ catalog เปลี่ยนล่าสุด (unix seconds) → Last-Modified ของ catalog endpoints ตรงกันทุก worker
+CREATE TABLE IF NOT EXISTS app_catalog_changed (id INTEGER PRIMARY KEY CHECK(id=1), at INTEGER NOT NULL);
+INSERT OR IGNORE INTO app_catalog_changed VALUES (1, CAST(strftime('%s','now') AS INTEGER));
+CREATE TRIGGER IF NOT EXISTS app_catalog_version_au AFTER UPDATE ON app_catalog_version BEGIN
+    UPDATE app_catalog_changed SET at = CAST(strftime('%s','now') AS INTEGER) WHERE id=1; END;
 
 CREATE TABLE IF NOT EXISTS projects (
     id              TEXT PRIMARY KEY,
@@ -2886,6 +3077,30 @@ CREATE TABLE IF NOT EXISTS deploy_edges (
 );
 """
 
+# Full-text index over the /api/apps search columns (external-content FTS5 kept in sync by
+# triggers). The trigram tokenizer keeps LIKE '%term%' substring semantics for terms ≥ 3 chars.
+APP_FTS_DDL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5(
+    name, vendor, domain, capability,
+    content='applications', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS applications_fts_ai AFTER INSERT ON applications BEGIN
+    INSERT INTO applications_fts(rowid, name, vendor, domain, capability)
+    VALUES (new.rowid, new.name, new.vendor, new.domain, new.capability);
+END;
+CREATE TRIGGER IF NOT EXISTS applications_fts_ad AFTER DELETE ON applications BEGIN
+    INSERT INTO applications_fts(applications_fts, rowid, name, vendor, domain, capability)
+    VALUES ('delete', old.rowid, old.name, old.vendor, old.domain, old.capability);
+END;
+CREATE TRIGGER IF NOT EXISTS applications_fts_au AFTER UPDATE OF name, vendor, domain, capability ON applications BEGIN
+    INSERT INTO applications_fts(applications_fts, rowid, name, vendor, domain, capability)
+    VALUES ('delete', old.rowid, old.name, old.vendor, old.domain, old.capability);
+    INSERT INTO applications_fts(rowid, name, vendor, domain, capability)
+    VALUES (new.rowid, new.name, new.vendor, new.domain, new.capability);
+END;
+"""
+_FTS_ENABLED = False   # set by init_db() once the FTS5 table is in place
+
 def _seed_projects(conn, now: str):
     """Seed 15 realistic PPM projects linked to roadmap items and apps."""
     projects = [
@@ -2905,13 +3120,12 @@ def _seed_projects(conn, now: str):
         ("PRJ-014","PDPA Compliance Remediation","","Enhance","Closing","High","Green","Compliance","Thida K.","DPO",450000,430000,6,"2025-01-01","2025-05-31","2025-01-03","2025-05-28","100","Remediate data handling processes across all customer-facing systems for PDPA","Completed ahead of schedule"),
         ("PRJ-015","API Gateway Consolidation","","Modernize","On Hold","Low","Red","Modernization","Chai W.","Infra Director",700000,150000,3,"2025-02-01","2025-10-31","2025-02-10","","15","Consolidate 4 disparate API gateways into unified platform","On hold — resource reallocation to PRJ-008"),
     ]
-    for p in projects:
-        conn.execute("""INSERT OR IGNORE INTO projects
-            (id,name,roadmap_id,type,status,priority,health,strategic_theme,pm,sponsor,
-             budget,actual_cost,team_size,planned_start,planned_end,actual_start,actual_end,
-             completion_pct,description,notes,created_at,updated_at)
-            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-            (*p, now, now))
+    conn.executemany("""INSERT OR IGNORE INTO projects
+        (id,name,roadmap_id,type,status,priority,health,strategic_theme,pm,sponsor,
+         budget,actual_cost,team_size,planned_start,planned_end,actual_start,actual_end,
+         completion_pct,description,notes,created_at,updated_at)
+        VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+        [(*p, now, now) for p in projects])
 
     # project_apps: link projects → applications
     pa = [
@@ -2985,86 +3199,114 @@ def _seed_projects(conn, now: str):
     print(f"  Seeded {len(projects)} projects, {len(pa)} app-links, {len(ms)} milestones")
 
 
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    """DDL + column migrations + indices + FTS — idempotent, runs on every start."""
+    conn.executescript(DDL)
+    # Migration: เพิ่ม column biz_owner สำหรับ DB เก่าที่สร้างไว้ก่อนหน้า
+    existing_cols = {row[1] for row in conn.execute("PRAGMA table_info(applications)").fetchall()}
+    if "biz_owner" not in existing_cols:
+        conn.execute("ALTER TABLE applications ADD COLUMN biz_owner TEXT")
+        print("  Migration: added column biz_owner")
+    if "compliance" not in existing_cols:
+        conn.execute("ALTER TABLE applications ADD COLUMN compliance TEXT DEFAULT '[]'")
+        print("  Migration: added column compliance")
+    # Indices — created after migrations so every referenced column exists
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_apps_active_id ON applications(decommissioned, id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_apps_domain    ON applications(domain)   WHERE decommissioned=0")
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_apps_status    ON applications(status)   WHERE decommissioned=0")
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_apps_bcg       ON applications(bcg)      WHERE decommissioned=0")
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_apps_ea_group  ON applications(ea_group) WHERE decommissioned=0")
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_apps_ea        ON applications(ea_group, ea_category) WHERE decommissioned=0")
+    global _FTS_ENABLED
+    try:
+        fts_new = conn.execute("SELECT 1 FROM sqlite_master WHERE name='applications_fts'").fetchone() is None
+        conn.executescript(APP_FTS_DDL)
+        if fts_new:   # back-fill rows that predate the index
+            conn.execute("INSERT INTO applications_fts(applications_fts) VALUES('rebuild')")
+        _FTS_ENABLED = True
+    except sqlite3.OperationalError as ex:
+        print(f"  Warning: FTS5 unavailable ({ex}) — /api/apps search falls back to LIKE")
+    conn.execute("INSERT OR REPLACE INTO config VALUES ('app_version', ?)", (APP_VERSION,))
+
+    # Migration: re-assign compliance if DB still has old 6-standard format
+    _NEW_STANDARDS = {"TOGAF 10th Ed.", "COBIT 2019", "ITIL 4", "ISO/IEC 27001",
+                      "NIST CSF 2.0", "GDPR / Thailand PDPA", "ISO 22301"}
+    try:
+        _sample = conn.execute(
+            "SELECT compliance FROM applications WHERE compliance IS NOT NULL AND compliance!='[]' LIMIT 30"
+        ).fetchall()
+        _found = {v for row in _sample for v in _json_loads(row[0] or "[]")}
+        if _found and not (_found & _NEW_STANDARDS):   # none of the new standards present
+            print("  Migration: re-assigning compliance with expanded standards…")
+            _rows = [dict(r) for r in conn.execute("SELECT * FROM applications").fetchall()]
+            _rows = _assign_compliance(_rows)
+            conn.executemany(
+                "UPDATE applications SET compliance=? WHERE id=?",
+                [(r["compliance"], r["id"]) for r in _rows]
+            )
+            print(f"    Updated compliance for {len(_rows)} apps")
+    except Exception as _ex:
+        print(f"  Warning: compliance migration skipped ({_ex})")
+
+def _seed_if_empty(conn: sqlite3.Connection) -> None:
+    """Seed apps / roadmap / projects into tables that are still empty. seed_apps.json is read only
+    when applications has no rows, so a warm start never loads it."""
+    now = datetime.now().strftime("%Y-%m-%d")
+    if conn.execute("SELECT 1 FROM applications LIMIT 1").fetchone() is None:
+        rows = _seed_app_rows()
+        conn.executemany("""
+            INSERT OR IGNORE INTO applications VALUES (
+                :id,:name,:domain,:vendor,:type,:status,:bcg,
+                :health,:tech_debt,:age,:tco,:users,:criticality,
+                :dr,:eol,:pi_spi,:contract_end,:integration,:stack,
+                :capability,:strategic,:persons,:src_avail,:service_hour,
+                :maint_window,:lang,:os,:db_platform,:support,:owner,
+                :biz_owner,:compliance,:stream,:approach,:assess_status,:assess_date,:wave,
+                :ea_group,:ea_category,:ea_sub_category,
+                0,NULL,NULL,:last_updated
+            )
+        """, rows)
+        print(f"  Seeded {len(rows)} applications")
+    if conn.execute("SELECT 1 FROM roadmap_items LIMIT 1").fetchone() is None:
+        sample_items = [
+            ("RM-0001", "APP-001", "Core Banking Upgrade",     "Upgrade",   "2025-Q1", "2025-Q3", 1, 2500000, "IT Director", "In Progress", "High",   "#00d68f", ""),
+            ("RM-0002", "APP-002", "ERP Migration to Cloud",   "Migrate",   "2025-Q2", "2026-Q1", 1, 4800000, "EA Team",     "Planning",    "High",   "#4a9eff", ""),
+            ("RM-0003", "APP-005", "Legacy HR System Retire",  "Retire",    "2025-Q1", "2025-Q2", 1,  300000, "HR Owner",    "In Progress", "Medium", "#ff4757", "Migrate users to new HCM"),
+            ("RM-0004", None,      "New Customer Portal",      "New",       "2025-Q2", "2026-Q2", 1, 3200000, "Digital Team","Planning",    "High",   "#7b61ff", "Greenfield project"),
+            ("RM-0005", "APP-008", "Data Warehouse Modernize", "Modernize", "2025-Q3", "2026-Q4", 2, 5500000, "Data Team",   "Planning",    "Medium", "#ffa000", ""),
+            ("RM-0006", "APP-003", "Middleware Platform Update","Upgrade",  "2025-Q2", "2025-Q4", 1, 1200000, "Infra Team",  "Planning",    "Medium", "#00d68f", ""),
+            ("RM-0007", None,      "AI/ML Platform",           "New",       "2026-Q1", "2027-Q2", 3, 8000000, "CTO Office",  "Planning",    "High",   "#7b61ff", "Strategic initiative"),
+            ("RM-0008", "APP-010", "Security Platform Upgrade","Upgrade",   "2025-Q1", "2025-Q3", 1, 1800000, "CISO",        "In Progress", "High",   "#00d68f", "Zero Trust implementation"),
+            ("RM-0009", "APP-015", "ERP Phase-out",            "Migrate",   "2025-Q3", "2026-Q2", 2, 2200000, "ERP Team",    "Planning",    "Medium", "#4a9eff", ""),
+            ("RM-0010", None,      "DevSecOps Pipeline",       "New",       "2025-Q2", "2025-Q4", 1,  950000, "DevOps Team", "In Progress", "Medium", "#7b61ff", ""),
+        ]
+        conn.executemany("""INSERT OR IGNORE INTO roadmap_items
+            (id,app_id,title,lane,start_qtr,end_qtr,wave,budget,owner,status,priority,color,notes,created_at,updated_at)
+            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
+            [(*item, now, now) for item in sample_items])
+        print(f"  Seeded {len(sample_items)} roadmap items")
+    # ── PPM Projects seed ──────────────────────────────────────────────────
+    if conn.execute("SELECT 1 FROM projects LIMIT 1").fetchone() is None:
+        _seed_projects(conn, now)
+
 def init_db():
-    with get_db() as conn:
-        conn.executescript(DDL)
-        # Migration: เพิ่ม column biz_owner สำหรับ DB เก่าที่สร้างไว้ก่อนหน้า
-        existing_cols = {row[1] for row in conn.execute("PRAGMA table_info(applications)").fetchall()}
-        if "biz_owner" not in existing_cols:
-            conn.execute("ALTER TABLE applications ADD COLUMN biz_owner TEXT")
-            print("  Migration: added column biz_owner")
-        if "compliance" not in existing_cols:
-            conn.execute("ALTER TABLE applications ADD COLUMN compliance TEXT DEFAULT '[]'")
-            print("  Migration: added column compliance")
-        conn.execute("INSERT OR REPLACE INTO config VALUES ('app_version', ?)", (APP_VERSION,))
-
-        # Migration: re-assign compliance if DB still has old 6-standard format
-        _NEW_STANDARDS = {"TOGAF 10th Ed.", "COBIT 2019", "ITIL 4", "ISO/IEC 27001",
-                          "NIST CSF 2.0", "GDPR / Thailand PDPA", "ISO 22301"}
-        try:
-            _sample = conn.execute(
-                "SELECT compliance FROM applications WHERE compliance IS NOT NULL AND compliance!='[]' LIMIT 30"
-            ).fetchall()
-            _found = {v for row in _sample for v in json.loads(row[0] or "[]")}
-            if _found and not (_found & _NEW_STANDARDS):   # none of the new standards present
-                print("  Migration: re-assigning compliance with expanded standards…")
-                _rows = [dict(r) for r in conn.execute("SELECT * FROM applications").fetchall()]
-                _rows = _assign_compliance(_rows)
-                conn.executemany(
-                    "UPDATE applications SET compliance=? WHERE id=?",
-                    [(r["compliance"], r["id"]) for r in _rows]
-                )
-                print(f"    Updated compliance for {len(_rows)} apps")
-        except Exception as _ex:
-            print(f"  Warning: compliance migration skipped ({_ex})")
-
-        if conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0] == 0:
-            rows = _seed_apps()
-            rows = _assign_biz_owner(rows)    # assign Business App Owner name ตาม domain
-            rows = _assign_compliance(rows)   # random compliance จาก attributes ของแต่ละ app
-            # ensure every seed dict has required keys for named binding
-            rows = [{**r, "biz_owner": r.get("biz_owner"), "compliance": r.get("compliance", "[]")} for r in rows]
-            conn.executemany("""
-                INSERT OR IGNORE INTO applications VALUES (
-                    :id,:name,:domain,:vendor,:type,:status,:bcg,
-                    :health,:tech_debt,:age,:tco,:users,:criticality,
-                    :dr,:eol,:pi_spi,:contract_end,:integration,:stack,
-                    :capability,:strategic,:persons,:src_avail,:service_hour,
-                    :maint_window,:lang,:os,:db_platform,:support,:owner,
-                    :biz_owner,:compliance,:stream,:approach,:assess_status,:assess_date,:wave,
-                    :ea_group,:ea_category,:ea_sub_category,
-                    0,NULL,NULL,:last_updated
-                )
-            """, rows)
-            print(f"  Seeded {len(rows)} applications")
-        if conn.execute("SELECT COUNT(*) FROM roadmap_items").fetchone()[0] == 0:
-            now = datetime.now().strftime("%Y-%m-%d")
-            sample_items = [
-                ("RM-0001", "APP-001", "Core Banking Upgrade",     "Upgrade",   "2025-Q1", "2025-Q3", 1, 2500000, "IT Director", "In Progress", "High",   "#00d68f", ""),
-                ("RM-0002", "APP-002", "ERP Migration to Cloud",   "Migrate",   "2025-Q2", "2026-Q1", 1, 4800000, "EA Team",     "Planning",    "High",   "#4a9eff", ""),
-                ("RM-0003", "APP-005", "Legacy HR System Retire",  "Retire",    "2025-Q1", "2025-Q2", 1,  300000, "HR Owner",    "In Progress", "Medium", "#ff4757", "Migrate users to new HCM"),
-                ("RM-0004", None,      "New Customer Portal",      "New",       "2025-Q2", "2026-Q2", 1, 3200000, "Digital Team","Planning",    "High",   "#7b61ff", "Greenfield project"),
-                ("RM-0005", "APP-008", "Data Warehouse Modernize", "Modernize", "2025-Q3", "2026-Q4", 2, 5500000, "Data Team",   "Planning",    "Medium", "#ffa000", ""),
-                ("RM-0006", "APP-003", "Middleware Platform Update","Upgrade",  "2025-Q2", "2025-Q4", 1, 1200000, "Infra Team",  "Planning",    "Medium", "#00d68f", ""),
-                ("RM-0007", None,      "AI/ML Platform",           "New",       "2026-Q1", "2027-Q2", 3, 8000000, "CTO Office",  "Planning",    "High",   "#7b61ff", "Strategic initiative"),
-                ("RM-0008", "APP-010", "Security Platform Upgrade","Upgrade",   "2025-Q1", "2025-Q3", 1, 1800000, "CISO",        "In Progress", "High",   "#00d68f", "Zero Trust implementation"),
-                ("RM-0009", "APP-015", "ERP Phase-out",            "Migrate",   "2025-Q3", "2026-Q2", 2, 2200000, "ERP Team",    "Planning",    "Medium", "#4a9eff", ""),
-                ("RM-0010", None,      "DevSecOps Pipeline",       "New",       "2025-Q2", "2025-Q4", 1,  950000, "DevOps Team", "In Progress", "Medium", "#7b61ff", ""),
-            ]
-            for item in sample_items:
-                conn.execute("""INSERT OR IGNORE INTO roadmap_items
-                    (id,app_id,title,lane,start_qtr,end_qtr,wave,budget,owner,status,priority,color,notes,created_at,updated_at)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)""",
-                    (*item, now, now))
-            print(f"  Seeded {len(sample_items)} roadmap items")
-        # ── PPM Projects seed ──────────────────────────────────────────────────
-        if conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0] == 0:
-            _seed_projects(conn, now if 'now' in dir() else datetime.now().strftime("%Y-%m-%d"))
+    with get_db(write=True) as conn:
+        _ensure_schema(conn)
+        # seed ทั้งหมด (apps / roadmap / projects) + counter + ANALYZE ใน transaction เดียว — commit ครั้งเดียวตอนออกจาก get_db
+        if conn.in_transaction: conn.commit()   # ปิดงาน migration ข้างบนก่อน
+        conn.execute("BEGIN IMMEDIATE")
+        _seed_if_empty(conn)
+        sync_app_counter(conn)
+        conn.execute("ANALYZE")   # refresh planner stats so the partial indices get picked
+    # เริ่มด้วย WAL ว่าง — fold หน้าค้างจากรอบก่อนกลับเข้า main DB แล้วตัดไฟล์ -wal ทิ้ง
+    with get_db(write=True) as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
     print(f"DB ready: {DB_PATH}")
 
 # ─── MODELS ────────────────────────────────────────────────────────────────────
 class AppWrite(BaseModel):
+    model_config = ConfigDict(extra="ignore")
     name: Optional[str] = None
     domain: Optional[str] = None
     vendor: Optional[str] = None
@@ -3106,6 +3348,7 @@ class AppWrite(BaseModel):
     ea_sub_category: Optional[str] = None
 
 class DecommBody(BaseModel):
+    model_config = ConfigDict(extra="ignore")
     decomm_date: str
     decomm_reason: Optional[str] = "ไม่ระบุ"
 
@@ -3224,26 +3467,81 @@ class ProjectMilestoneWrite(BaseModel):
 def row_to_dict(row) -> dict:
     d = dict(row)
     try:
-        d["stack"] = json.loads(d.get("stack") or "[]")
-    except (json.JSONDecodeError, ValueError):
+        d["stack"] = _json_loads(d.get("stack") or "[]")
+    except ValueError:
         d["stack"] = []
     try:
-        d["compliance"] = json.loads(d.get("compliance") or "[]")
-    except (json.JSONDecodeError, ValueError):
+        d["compliance"] = _json_loads(d.get("compliance") or "[]")
+    except ValueError:
         d["compliance"] = []
     for f in ("dr","pi_spi","src_avail","decommissioned"):
         if f in d: d[f] = bool(d[f])
     return d
 
+APP_COLUMNS = (
+    "id","name","domain","vendor","type","status","bcg","health","tech_debt","age","tco","users",
+    "criticality","dr","eol","pi_spi","contract_end","integration","stack","capability","strategic",
+    "persons","src_avail","service_hour","maint_window","lang","os","db_platform","support","owner",
+    "biz_owner","compliance","stream","approach","assess_status","assess_date","wave","ea_group",
+    "ea_category","ea_sub_category","decommissioned","decomm_date","decomm_reason","last_updated",
+)
+# แถวเดียวแบบ immutable/slot-based (tuple) สำหรับโค้ดที่ต้องอ่านทีละ app — แทน dict ต่อแถว
+AppRow = namedtuple("AppRow", APP_COLUMNS)
+_APP_BOOL_COLS = ("dr","pi_spi","src_avail","decommissioned")
+_APP_FLAG_BIT  = {c: 1 << b for b, c in enumerate(_APP_BOOL_COLS)}   # snapshot: 0/1 columns รวมเป็น 1 byte ต่อแถว
+_APP_JSON_COLS = ("stack","compliance")
+
+def app_json_sql(alias: str = "") -> str:
+    """SQL expression that renders one applications row as the same JSON object row_to_dict() gives,
+    so list endpoints can hand SQLite's output straight to the client without a Python pass per row."""
+    parts = []
+    for c in APP_COLUMNS:
+        col = alias + c
+        if c in _APP_BOOL_COLS:
+            expr = f"json(CASE WHEN {col} THEN 'true' ELSE 'false' END)"
+        elif c in _APP_JSON_COLS:
+            expr = f"json(CASE WHEN json_valid({col}) THEN {col} ELSE '[]' END)"
+        else:
+            expr = col
+        parts.append(f"'{c}',{expr}")
+    return "json_object(" + ",".join(parts) + ")"
+
+_APP_JSON    = app_json_sql()
+_APP_JSON_A  = app_json_sql("a.")
+
+_ident = lambda v: v
+# column ที่ PUT แก้ได้ (allow-list สำหรับ UPDATE แบบ dynamic) + การแปลงค่าให้ตรงกับ INSERT
+_APP_UPDATABLE = frozenset(APP_COLUMNS) - {"id", "decommissioned", "decomm_date", "decomm_reason", "last_updated"}
+_APP_UPDATE_COERCE = {
+    "health":          lambda v: int(v or 75),
+    "age":             lambda v: int(v or 0),
+    "tco":             lambda v: int(v or 0),
+    "users":           lambda v: int(v or 0),
+    "integration":     lambda v: int(v or 0),
+    "strategic":       lambda v: int(v or 70),
+    "persons":         lambda v: int(v or 1),
+    "wave":            lambda v: int(v or 3),
+    "dr":              lambda v: int(v or False),
+    "pi_spi":          lambda v: int(v or False),
+    "src_avail":       lambda v: int(v if v is not None else True),
+    "stack":           lambda v: json.dumps(v or []),
+    "compliance":      lambda v: json.dumps(v or []),
+    "ea_sub_category": lambda v: v or "-",
+}
+
+def sync_app_counter(conn) -> None:
+    """Move app_counter up to the highest numeric APP-id in the table (never down)."""
+    conn.execute("""INSERT INTO app_counter (id, seq)
+        SELECT 1, COALESCE(MAX(CAST(SUBSTR(id, 5) AS INTEGER)), 0) FROM applications WHERE true
+        ON CONFLICT(id) DO UPDATE SET seq = MAX(seq, excluded.seq)""")
+
 def next_id(conn) -> str:
-    # BUG-04: ใช้ numeric sort แทน lexicographic เพื่อรองรับ > 999 apps
-    row = conn.execute(
-        "SELECT id FROM applications ORDER BY CAST(SUBSTR(id, 5) AS INTEGER) DESC LIMIT 1"
-    ).fetchone()
-    try:
-        return f"APP-{int((row['id'] if row else 'APP-000').split('-')[1]) + 1:03d}"
-    except (ValueError, IndexError, TypeError):
-        return "APP-001"
+    # BUG-04: นับเลขจาก app_counter แทนการ scan หา id สูงสุดทุกครั้ง — O(1) และอยู่ใน transaction เดียวกับ INSERT
+    row = conn.execute("UPDATE app_counter SET seq = seq + 1 WHERE id=1 RETURNING seq").fetchone()
+    if row is None:
+        sync_app_counter(conn)
+        row = conn.execute("UPDATE app_counter SET seq = seq + 1 WHERE id=1 RETURNING seq").fetchone()
+    return f"APP-{row[0]:03d}"
 
 # ── Auth routes ───────────────────────────────────────────────────────────────
 @app.post("/api/auth/login")
@@ -3488,6 +3786,352 @@ def r_roadmap_delete(item_id: str, current_user: dict = Depends(_require_writer)
         conn.execute("DELETE FROM roadmap_items WHERE id=?", (item_id,))
     return {"message": "Deleted"}
 
+# ─── RESPONSE CACHE (TTL + ETag) ───────────────────────────────────────────────
+# key -> (expires_at, etag, body, version) — rendered JSON kept in RAM until TTL / bust / version change.
+# _bust_cache only reaches this process; entries derived from the app catalog also carry its DB-backed
+# app_catalog_version, so a write through any worker invalidates them everywhere on the next request
+_RESP_CACHE: dict = {}
+
+def _cached_json(key: str, ttl: float, build, version=None) -> tuple:
+    now = time.monotonic()
+    hit = _RESP_CACHE.get(key)
+    if hit and hit[0] > now and hit[3] == version:
+        return hit
+    body = _json_dumps(build())
+    etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    _RESP_CACHE[key] = entry = (now + ttl, etag, body, version)
+    return entry
+
+def _etag_response(request: Request, key: str, ttl: float, build, version=None) -> Response:
+    """Serve build() from the TTL cache with an ETag; 304 when the client already has it."""
+    _, etag, body, _ = _cached_json(key, ttl, build, version)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _bust_cache(*keys: str) -> None:
+    for k in keys: _RESP_CACHE.pop(k, None)
+
+# ─── APP CATALOG SNAPSHOT (in-memory, column-oriented) ─────────────────────────
+# applications ทั้งตารางเก็บเป็น SoA: 1 column = 1 sequence (ตัวเลขเป็น array แบบ packed) แทน list ของ dict
+# rebuild เฉพาะเมื่อ app_catalog_version (trigger) เปลี่ยน — worker ทุกตัวเห็นการเขียนของกันและกัน
+_APP_INT_COLS = ("health","tech_debt","age","tco","users","integration","strategic","persons",
+                 "wave","dr","pi_spi","src_avail","decommissioned")
+# low-cardinality text → dictionary-encoded (1 code ต่อแถว + ตาราง label เล็ก ๆ) — equality filter / group-by เทียบ int
+_APP_DICT_COLS = ("bcg","status","criticality","domain","ea_group","approach","stream","owner","ea_category",
+                  "type","service_hour","maint_window","os","support","assess_status")
+# 'YYYY-MM[-DD]' text → int YYYYMM ครั้งเดียวตอน rebuild; ค่าที่ไม่ใช่วันที่ ('N/A', '', NULL) = -1
+_APP_YM_COLS   = ("eol","contract_end","assess_date","last_updated")
+# exact-match filter ผ่าน inverted index (ค่า → ตำแหน่งแถว) — capability ค่าหลากหลายเกินกว่าจะ dictionary-encode,
+# wave เป็น int
+_APP_INDEX_COLS = ("capability","wave")
+# text ที่ค่าซ้ำกันมาก — sys.intern ให้ทุกแถวชี้ str object เดียวกัน (ประหยัด RAM, เทียบ == ได้เร็ว)
+_APP_INTERN_COLS = _APP_DICT_COLS + ("vendor","lang","db_platform","ea_sub_category","biz_owner")
+_YM_RE = re.compile(r"^(\d{4})-(0[1-9]|1[0-2])(?:-\d{2})?$")   # YYYY-MM หรือ YYYY-MM-DD, เดือน 01–12
+# derived score คำนวณใน SQLite (C) ระหว่าง SELECT ตอน rebuild — NULL input ใด ๆ → NULL
+_APP_DERIVED_SQL = {
+    "risk":  "ROUND(tech_debt*0.4 + (100-health)*0.3 + age*2 + (1-dr)*10, 1)",
+    "score": "ROUND(health*0.4 + (100-tech_debt)*0.3 + strategic*0.3, 1)",   # weighted health
+}
+_APP_DERIVED_SELECT = ", ".join(f"{sql} AS _{name}" for name, sql in _APP_DERIVED_SQL.items())
+
+def ym_key(v) -> int:
+    m = _YM_RE.match(v) if isinstance(v, str) else None
+    return int(m[1]) * 100 + int(m[2]) if m else -1
+
+# (typecode, min, max) จากเล็กไปใหญ่ — health/dr/wave ลงที่ 1 byte, tco/users ที่ 2–4 byte
+_INT_TYPECODES = tuple((tc, -(1 << (8 * array(tc).itemsize - 1)), (1 << (8 * array(tc).itemsize - 1)) - 1)
+                       for tc in "bhiq")
+
+def _dict_encode(vals: list) -> tuple:
+    """(codes, labels, label→code) — labels in first-seen order, None is a label like any other."""
+    index: dict = {}
+    codes = array("B" if len(set(vals)) <= 256 else "H", (index.setdefault(v, len(index)) for v in vals))
+    return codes, tuple(index), index
+
+def _parse_str_list(v) -> tuple:
+    try:
+        items = _json_loads(v or "[]")
+    except ValueError:
+        return ()
+    return tuple(sys.intern(t) for t in items if isinstance(t, str)) if isinstance(items, list) else ()
+
+def _avg1(vals: list) -> Optional[float]:
+    """Mean rounded to 1 decimal, half away from zero — same as SQLite ROUND(AVG(x),1)."""
+    return float((Decimal(sum(vals)) / len(vals)).quantize(Decimal("0.1"), ROUND_HALF_UP)) if vals else None
+
+def _pack_ints(vals: list):
+    """Narrowest signed array that holds every value when all are plain ints,
+    else the list unchanged (NULL/REAL/text stay exact)."""
+    if not all(type(v) is int for v in vals):
+        return vals
+    lo, hi = (min(vals), max(vals)) if vals else (0, 0)
+    for tc, tmin, tmax in _INT_TYPECODES:
+        if tmin <= lo and hi <= tmax:
+            return array(tc, vals)
+    return vals
+
+# content-coding → compressor ของ body snapshot; เรียกตอน request แรกที่ขอ coding นั้น (ไม่บีบทุก coding ล่วงหน้า)
+_COMPRESS = {"gzip": lambda raw: gzip.compress(raw, 6, mtime=0)}
+if brotli is not None:
+    _COMPRESS["br"] = lambda raw: brotli.compress(raw, quality=5)   # q11 ใช้ ~150 ms ต่อ body ~100 KB — หนักเกินสำหรับ request path
+
+class AppCatalog:
+    """Snapshot of applications at one app_catalog_version, ordered by id."""
+
+    def __init__(self, version: int, rows: list, changed_at: int = 0):
+        self.version = version
+        self.last_modified = email.utils.formatdate(changed_at, usegmt=True)   # HTTP-date ของการเขียนล่าสุด
+        self.changed_at    = changed_at
+        self.n       = len(rows)
+        self.json    = tuple(r["_json"] for r in rows)     # row → JSON object text, rendered by SQLite (app_json_sql)
+        self.pos_of  = MappingProxyType({r["id"]: i for i, r in enumerate(rows)})
+        self.cols    = {c: [r[c] for r in rows] for c in APP_COLUMNS}
+        for c in _APP_INT_COLS:
+            self.cols[c] = _pack_ints(self.cols[c])
+        for c in _APP_INTERN_COLS:
+            self.cols[c] = [sys.intern(v) if type(v) is str else v for v in self.cols[c]]
+        self.codes, self.labels, self.code_of = {}, {}, {}
+        self.rows_by_code = {}   # col → [positions ของแต่ละ code] — hash index สำหรับ equality filter
+        for c in _APP_DICT_COLS:
+            self.codes[c], self.labels[c], self.code_of[c] = _dict_encode(self.cols[c])
+            lists = [array("H" if self.n <= 65536 else "l") for _ in self.labels[c]]
+            for i, code in enumerate(self.codes[c]): lists[code].append(i)
+            self.rows_by_code[c] = tuple(lists)
+        self.ym = {c: array("i", map(ym_key, self.cols[c])) for c in _APP_YM_COLS}   # YYYYMM ≤ 999912 → 4 bytes
+        # stack/compliance: JSON text → tuple ของ str ที่ intern แล้ว ครั้งเดียว + inverted index ของ stack
+        # (lower-case tech → ตำแหน่งแถว)
+        self.stacks     = tuple(_parse_str_list(v) for v in self.cols["stack"])
+        self.compliance = tuple(_parse_str_list(v) for v in self.cols["compliance"])
+        by_tech: dict = {}
+        for i, techs in enumerate(self.stacks):
+            for t in {t.lower() for t in techs}:
+                by_tech.setdefault(t, array("H" if self.n <= 65536 else "l")).append(i)
+        self.by_tech = MappingProxyType(by_tech)
+        index: dict = {}
+        for c in _APP_INDEX_COLS:
+            m = index[c] = {}
+            for i, v in enumerate(self.cols[c]):
+                if v is not None and v != "": m.setdefault(v, array("H" if self.n <= 65536 else "l")).append(i)
+        self.index = MappingProxyType({c: MappingProxyType(m) for c, m in index.items()})
+        # derived columns: SQLite คำนวณมาให้ใน query rebuild (_APP_DERIVED_SQL) — ไม่มี loop Python ต่อแถว
+        # ROUND() คืน REAL เสมอ → array 'd' (8 byte/ค่า แทน float object) เว้นแต่มี NULL
+        for name in _APP_DERIVED_SQL:
+            vals = [r["_" + name] for r in rows]
+            self.cols[name] = array("d", vals) if all(type(v) is float for v in vals) else vals
+        # 0/1 columns → bitfield 1 byte ต่อแถว (dr|pi_spi|src_avail|decommissioned) — filter flag ได้ด้วย mask เดียว
+        self.flags = bytes(sum(bit for c, bit in _APP_FLAG_BIT.items() if self.cols[c][i]) for i in range(self.n))
+        # 1 byte ต่อแถว: แถวที่ยังไม่ decommission — ใช้กับ itertools.compress
+        dec = _APP_FLAG_BIT["decommissioned"]
+        self.active = bytes(0 if f & dec else 1 for f in self.flags)
+        # snapshot ถูกแชร์ทุก thread/request — freeze เป็น tuple/MappingProxyType กัน handler แก้โดยไม่ตั้งใจ
+        self.cols    = MappingProxyType({c: v if isinstance(v, array) else tuple(v) for c, v in self.cols.items()})
+        self.codes   = MappingProxyType(self.codes)
+        self.labels  = MappingProxyType(self.labels)
+        self.code_of = MappingProxyType({c: MappingProxyType(m) for c, m in self.code_of.items()})
+        self.rows_by_code = MappingProxyType(self.rows_by_code)
+        self._sorted: dict = {}   # col → sorted index สำหรับ range filter (/api/apps?tco_min=&tco_max=) สร้างตอนใช้ครั้งแรก
+        self._bodies: dict = {}   # query → {None: raw, coding: compressed} — encode/compress ครั้งเดียวต่อ snapshot
+
+    def encoded(self, key, build, coding: Optional[str] = None) -> tuple:
+        """(coding or None, bytes) of `key`'s response. The body is built once per snapshot and compressed
+        only into the requested coding, on first use, then kept alongside it (64 keys, first come first kept).
+        key=None or a full cache builds for this request alone; bodies under 1 KB go out uncompressed."""
+        entry = None if key is None else self._bodies.get(key)
+        if entry is None:
+            entry = {None: build()}
+            if key is not None and len(self._bodies) < 64: self._bodies[key] = entry
+        raw = entry[None]
+        if coding is None or len(raw) < 1024: return None, raw
+        data = entry.get(coding)
+        if data is None: data = entry[coding] = _COMPRESS[coding](raw)
+        return coding, data
+
+    def row(self, i: int) -> AppRow:
+        """Row at position i as an AppRow (raw column values: stack/compliance stay JSON text, flags 0/1)."""
+        c = self.cols
+        return AppRow._make(c[k][i] for k in APP_COLUMNS)
+
+    def sorted_index(self, col: str) -> tuple:
+        """(values ascending, row positions in that order) — NULL/non-numeric rows left out.
+        Date columns (_APP_YM_COLS) are indexed by their YYYYMM key, rows without a real date left out."""
+        idx = self._sorted.get(col)
+        if idx is None:
+            if col in self.ym:
+                vals  = self.ym[col]
+                order = sorted((i for i in range(self.n) if vals[i] >= 0), key=vals.__getitem__)
+            else:
+                vals  = self.cols[col]
+                order = sorted((i for i in range(self.n) if type(vals[i]) in (int, float)), key=vals.__getitem__)
+            idx = self._sorted[col] = ([vals[i] for i in order], array("l", order))
+        return idx
+
+    def between(self, pos: list, col: str, lo=None, hi=None) -> list:
+        """Keep positions with lo <= col <= hi (either bound optional) via binary search on the sorted index."""
+        keys, order = self.sorted_index(col)
+        a = 0 if lo is None else bisect_left(keys, lo)
+        b = len(keys) if hi is None else bisect_right(keys, hi)
+        hits = set(order[a:b])
+        return [i for i in pos if i in hits]
+
+    def select(self, include_decomm: bool = False, **eq) -> list:
+        """Row positions (id order) matching every non-empty equality filter on a dictionary-encoded column.
+        Starts from the smallest per-value index list, so cost follows the result size rather than n."""
+        hits = []
+        for col, val in eq.items():
+            if not val: continue
+            code = self.code_of[col].get(val)
+            if code is None: return []
+            hits.append(self.rows_by_code[col][code])
+        if not hits:
+            return list(range(self.n)) if include_decomm else list(compress(range(self.n), self.active))
+        hits.sort(key=len)
+        rest, act = [set(h) for h in hits[1:]], self.active
+        return [i for i in hits[0] if (include_decomm or act[i]) and all(i in r for r in rest)]
+
+    def using(self, pos: list, tech: str) -> list:
+        """Keep positions whose stack lists `tech` (case-insensitive exact item)."""
+        hits = set(self.by_tech.get(tech.lower(), ()))
+        return [i for i in pos if i in hits]
+
+    def stack_matches(self, q: str) -> set:
+        """Positions whose stack has an item containing `q` (case-insensitive) — scans the distinct tech vocabulary, not rows."""
+        q = q.lower()
+        return {i for t, rows in self.by_tech.items() if q in t for i in rows}
+
+    @functools.cached_property
+    def members(self) -> MappingProxyType:
+        """col → per-row '"col":value' JSON text — each row's JSON parsed once, each member encoded once per snapshot."""
+        out = {c: [] for c in APP_COLUMNS}
+        for d in map(_json_loads, self.json):
+            for c in APP_COLUMNS: out[c].append(d[c])
+        return MappingProxyType({c: tuple(f'"{c}":' + _json_dumps(v).decode() for v in vals) for c, vals in out.items()})
+
+    def project(self, pos: list, fields: tuple) -> bytes:
+        """JSON array holding only `fields` of each row, in APP_COLUMNS order — stitched from pre-encoded members."""
+        m = [self.members[f] for f in fields]
+        return ("[" + ",".join("{" + ",".join(col[i] for col in m) + "}" for i in pos) + "]").encode()
+
+    def distinct(self, col: str, include_decomm: bool = False) -> tuple:
+        """Sorted distinct non-empty values of a categorical column (filter dropdowns)."""
+        vals = self.cols[col] if include_decomm else compress(self.cols[col], self.active)
+        return tuple(sorted({v for v in vals if v}))
+
+    def flagged(self, pos: list, **want) -> list:
+        """Keep positions whose 0/1 flags match every given True/False (None = don't care)."""
+        mask = val = 0
+        for col, v in want.items():
+            if v is None: continue
+            mask |= _APP_FLAG_BIT[col]
+            if v: val |= _APP_FLAG_BIT[col]
+        if not mask: return pos
+        flags = self.flags
+        return [i for i in pos if flags[i] & mask == val]
+
+    def where(self, pos: list, col: str, value: str) -> list:
+        """Keep positions whose indexed column equals `value` exactly."""
+        hits = set(self.index[col].get(value, ()))
+        return [i for i in pos if i in hits]
+
+    def months(self, pos: list, col: str, start: int = 0, end: Optional[int] = None) -> list:
+        """Keep positions whose date column is a real date with start <= YYYYMM < end (binary search on the sorted index)."""
+        keys, order = self.sorted_index(col)
+        hits = set(order[bisect_left(keys, start):len(keys) if end is None else bisect_left(keys, end)])
+        return [i for i in pos if i in hits]
+
+    def _count(self, mask: bytes, col: str, value) -> int:
+        code = self.code_of[col].get(value)
+        return 0 if code is None else list(compress(self.codes[col], mask)).count(code)
+
+    @functools.cached_property
+    def digest(self) -> bytes:
+        """SHA-256 over every row's JSON — content identity of this snapshot."""
+        h = hashlib.sha256()
+        for j in self.json: h.update(j.encode())
+        return h.digest()
+
+    def etag(self, request: Request) -> str:
+        """ETag for a response derived from this snapshot: content hash + request path and query.
+        Precompressed bodies carry it with the content-coding appended (_coded_etag)."""
+        h = hashlib.sha256(self.digest)
+        h.update(request.url.path.encode()); h.update(b"?"); h.update(request.url.query.encode())
+        return '"' + h.hexdigest()[:32] + '"'
+
+    @functools.cached_property
+    def summary(self) -> dict:
+        """Dashboard group-bys over active apps — computed once per snapshot, the snapshot is the cache key."""
+        c, act = self.cols, self.active
+        def count_by(col):
+            if col in self.codes:   # นับ code (int) แล้วค่อยแปลงกลับเป็น label
+                lab = self.labels[col]
+                counts = ((lab[k], n) for k, n in Counter(compress(self.codes[col], act)).items())
+            else:
+                counts = Counter(compress(c[col], act)).items()
+            return {("" if k is None else str(k)): n for k, n in counts}
+        def tco_by(col):
+            out: dict = {}
+            for k, t in zip(compress(c[col], act), compress(c["tco"], act)):
+                if t is None: continue
+                k = "" if k is None else k
+                out[k] = out.get(k, 0) + t
+            return out
+        health_hist = [0] * 101
+        for h in compress(c["health"], act):
+            if type(h) is int and 0 <= h <= 100: health_hist[h] += 1
+        health_by_domain: dict = {}
+        for d, h in zip(compress(c["domain"], act), compress(c["health"], act)):
+            if h is not None: health_by_domain.setdefault("" if d is None else d, []).append(h)
+        by_category: dict = {}
+        for g, cat in zip(compress(c["ea_group"], act), compress(c["ea_category"], act)):
+            by_category[(g, cat)] = by_category.get((g, cat), 0) + 1
+        return {
+            "bcg": count_by("bcg"), "status": count_by("status"), "wave": count_by("wave"),
+            "ea_group": count_by("ea_group"), "domain": count_by("domain"),
+            "criticality": count_by("criticality"), "stream": count_by("stream"),
+            "tco_by_domain": tco_by("domain"), "tco_by_stream": tco_by("stream"),
+            "avg_health_by_domain": {d: _avg1(hs) for d, hs in health_by_domain.items()},
+            "health_hist": health_hist, "ea_category": by_category,
+        }
+
+    def stats(self) -> dict:
+        """Same numbers as the old /api/stats aggregate query."""
+        c, act = self.cols, self.active
+        avg = _avg1([h for h in compress(c["health"], act) if h is not None])
+        return {
+            "total_apps":       sum(act),
+            "active_apps":      self._count(act, "status", "Active"),
+            "mission_critical": self._count(act, "criticality", "Mission Critical"),
+            "total_tco":        sum(t for t in compress(c["tco"], act) if t is not None),
+            "domains":          len({d for d in compress(c["domain"], act) if d is not None}),
+            "avg_health":       avg,
+            "decommissioned":   sum(1 for d in c["decommissioned"] if d == 1),
+        }
+
+_CATALOG: Optional[AppCatalog] = None
+_CATALOG_LOCK = threading.Lock()
+
+def app_catalog() -> AppCatalog:
+    """Current catalog snapshot — one tiny version read per call, full reload only after a write."""
+    global _CATALOG
+    with get_db_ro() as conn:
+        ver = conn.execute("SELECT version FROM app_catalog_version WHERE id=1").fetchone()[0]
+        cat = _CATALOG
+        if cat is not None and cat.version == ver:
+            return cat
+        with _CATALOG_LOCK:
+            if _CATALOG is None or _CATALOG.version != ver:
+                conn.execute("BEGIN")   # version + rows from the same read snapshot
+                try:
+                    ver  = conn.execute("SELECT version FROM app_catalog_version WHERE id=1").fetchone()[0]
+                    at   = conn.execute("SELECT at FROM app_catalog_changed WHERE id=1").fetchone()[0]
+                    rows = conn.execute(f"SELECT {_APP_JSON} AS _json, {_APP_DERIVED_SELECT}, * "
+                                        "FROM applications ORDER BY id").fetchall()
+                finally:
+                    conn.rollback()
+                _CATALOG = AppCatalog(ver, rows, at)
+            return _CATALOG
+
 # ─── ROUTES ────────────────────────────────────────────────────────────────────
 @app.get("/health")
 def health_check():
@@ -3495,8 +4139,11 @@ def health_check():
     return {"status": "ok", "version": APP_VERSION}
 
 @app.get("/api/version")
-def r_version(current_user: dict = Depends(_require_auth)):
-    with get_db() as conn:
+def r_version(request: Request, current_user: dict = Depends(_require_auth)):
+    return _etag_response(request, "version", 60, _build_version)
+
+def _build_version() -> dict:
+    with get_db_ro() as conn:
         row = conn.execute("SELECT value FROM config WHERE key='app_version'").fetchone()
     ver = row["value"] if row else APP_VERSION
     return {
@@ -3510,7 +4157,7 @@ def r_version(current_user: dict = Depends(_require_auth)):
 
 @app.get("/api/config")
 def get_config(current_user: dict = Depends(_require_auth)):
-    """Return full mpx-studio.config.json (re-read each time so hot-editable)."""
+    """Return full mpx-studio.config.json (cached, re-read when the file's mtime changes so hot-editable)."""
     return _load_config()
 
 @app.get("/api/config/mpx2/badges")
@@ -3519,53 +4166,163 @@ def get_mpx2_badges(current_user: dict = Depends(_require_auth)):
     cfg = _load_config()
     return {"badges": cfg.get("mpx2", {}).get("badges", [])}
 
+_BODY_CODINGS = ("br", "gzip")   # preference order when the client accepts both
+
+def _coded_etag(etag: str, coding: Optional[str]) -> str:
+    """Strong ETag of one representation — '"<digest>-gzip"' / '"<digest>-br"' for a compressed body."""
+    return etag if coding is None else f'{etag[:-1]}-{coding}"'
+
+def _etag_matches(inm: str, etag: str) -> Optional[str]:
+    """The If-None-Match entry naming any coding of `etag` (weak comparison, RFC 9110 §13.1.2), else None."""
+    for tag in inm.split(","):
+        tag = tag.strip()
+        if tag == "*": return etag
+        if tag.removeprefix("W/") in [_coded_etag(etag, c) for c in (None, *_BODY_CODINGS)]:
+            return tag.removeprefix("W/")
+    return None
+
+def _catalog_cache_headers(request: Request, cat: AppCatalog) -> tuple:
+    """(headers, 304 response or None) — catalog endpoints skip filtering/encoding when the client is current.
+    If-None-Match wins when sent; If-Modified-Since is only consulted without it.
+    changed_at has 1-second resolution, so a write later in the same second would look unmodified: Last-Modified
+    is only sent once that second is over, and a change in the current second never answers 304 to a date."""
+    sealed  = cat.changed_at < int(time.time())
+    headers = {"ETag": cat.etag(request), "Cache-Control": "no-cache"}
+    if sealed: headers["Last-Modified"] = cat.last_modified
+    inm, ims = request.headers.get("if-none-match"), request.headers.get("if-modified-since")
+    if inm is not None:
+        match = _etag_matches(inm, headers["ETag"])
+        fresh = match is not None
+        if fresh: headers["ETag"] = match   # 304 names the representation the client holds
+    else:
+        try:    fresh = sealed and ims is not None and email.utils.parsedate_to_datetime(ims).timestamp() >= cat.changed_at
+        except (TypeError, ValueError): fresh = False
+    return headers, (Response(status_code=304, headers=headers) if fresh else None)
+
+def _encoded_response(request: Request, cat: AppCatalog, key, build, headers: dict) -> Response:
+    """Serve `key`'s snapshot body in the one coding the client negotiated — brotli, then gzip, else identity
+    (GZipMiddleware passes an already-encoded body through untouched)."""
+    coding = _negotiate_coding(request.headers.get("accept-encoding", ""), [c for c in _BODY_CODINGS if c in _COMPRESS])
+    enc, data = cat.encoded(key, build, coding)
+    if enc is None: return Response(content=data, media_type="application/json", headers=headers)
+    coded = {**headers, "Content-Encoding": enc, "Vary": "Accept-Encoding"}
+    if "ETag" in headers: coded["ETag"] = _coded_etag(headers["ETag"], enc)
+    return Response(content=data, media_type="application/json", headers=coded)
+
 @app.get("/api/stats")
-def r_stats(current_user: dict = Depends(_require_auth)):
-    # Replaced 7 separate COUNT/SUM queries with a single aggregate query
-    with get_db() as conn:
-        row = conn.execute("""
-            SELECT
-                COUNT(*)                                                        AS total_apps,
-                SUM(CASE WHEN status='Active'               THEN 1 ELSE 0 END) AS active_apps,
-                SUM(CASE WHEN criticality='Mission Critical' THEN 1 ELSE 0 END) AS mission_critical,
-                COALESCE(SUM(tco), 0)                                           AS total_tco,
-                COUNT(DISTINCT domain)                                          AS domains,
-                ROUND(AVG(CAST(health AS REAL)), 1)                             AS avg_health
-            FROM applications WHERE decommissioned=0
-        """).fetchone()
-        decomm = conn.execute("SELECT COUNT(*) FROM applications WHERE decommissioned=1").fetchone()[0]
-        result = dict(row)
-        result["decommissioned"] = decomm
-        return result
+def r_stats(request: Request, current_user: dict = Depends(_require_auth)):
+    cat = app_catalog()
+    headers, not_modified = _catalog_cache_headers(request, cat)
+    return not_modified or _encoded_response(request, cat, "stats", lambda: _json_dumps(cat.stats()), headers)
 
 @app.get("/api/apps")
-def r_list(status: Optional[str]=None, domain: Optional[str]=None,
+def r_list(request: Request, status: Optional[str]=None, domain: Optional[str]=None,
            bcg: Optional[str]=None, ea_group: Optional[str]=None,
            search: Optional[str]=None, show_decomm: bool=False,
+           eol_before: Optional[str]=None, contract_end_before: Optional[str]=None,
+           eol_from: Optional[str]=None, contract_end_from: Optional[str]=None,
+           tech: Optional[str]=None, owner: Optional[str]=None, stream: Optional[str]=None,
+           ea_category: Optional[str]=None, capability: Optional[str]=None, wave: Optional[int]=None,
+           health_min: Optional[float]=None, health_max: Optional[float]=None,
+           tco_min: Optional[float]=None, tco_max: Optional[float]=None,
+           age_min: Optional[float]=None, age_max: Optional[float]=None,
+           tech_debt_min: Optional[float]=None, tech_debt_max: Optional[float]=None,
+           risk_min: Optional[float]=None, risk_max: Optional[float]=None,
+           score_min: Optional[float]=None, score_max: Optional[float]=None,
+           dr: Optional[bool]=None, pi_spi: Optional[bool]=None, src_avail: Optional[bool]=None,
+           fields: Optional[str]=None, offset: int=0, limit: Optional[int]=None,
            current_user: dict = Depends(_require_auth)):
-    with get_db() as conn:
-        sql, p = "SELECT * FROM applications WHERE 1=1", []
-        if not show_decomm:                     sql += " AND decommissioned=0"
-        if status:  sql += " AND status=?";     p.append(status)
-        if domain:  sql += " AND domain=?";     p.append(domain)
-        if bcg:     sql += " AND bcg=?";        p.append(bcg)
-        if ea_group:sql += " AND ea_group=?";   p.append(ea_group)
+    cat = app_catalog()
+    headers, not_modified = _catalog_cache_headers(request, cat)
+    if not_modified: return not_modified
+    if fields:   # column projection: ส่งเฉพาะ field ที่ขอ (เช่น fields=id,name,tco)
+        want = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = want.difference(APP_COLUMNS)
+        if unknown: raise HTTPException(400, f"unknown fields: {', '.join(sorted(unknown))}")
+        cols = tuple(c for c in APP_COLUMNS if c in want)
+
+    def positions() -> list:
+        pos = cat.select(show_decomm, status=status, domain=domain, bcg=bcg, ea_group=ea_group,
+                         owner=owner, stream=stream, ea_category=ea_category)
+        if tech: pos = cat.using(pos, tech)
+        pos = cat.flagged(pos, dr=dr, pi_spi=pi_spi, src_avail=src_avail)
+        if capability: pos = cat.where(pos, "capability", capability)
+        if wave is not None: pos = cat.where(pos, "wave", wave)
+        for col, lo, hi in (("health", health_min, health_max), ("tco", tco_min, tco_max),
+                            ("age", age_min, age_max), ("tech_debt", tech_debt_min, tech_debt_max),
+                            ("risk", risk_min, risk_max), ("score", score_min, score_max)):
+            if lo is not None or hi is not None:
+                pos = cat.between(pos, col, lo, hi)
+        for col, start, end in (("eol", eol_from, eol_before),
+                                ("contract_end", contract_end_from, contract_end_before)):
+            if start or end:
+                lo, hi = (ym_key(start) if start else 0), (ym_key(end) if end else None)
+                if lo < 0 or (hi is not None and hi < 0):
+                    raise HTTPException(400, f"{col}_from / {col}_before must be YYYY-MM")
+                pos = cat.months(pos, col, lo, hi)
         if search:
-            sql += " AND (name LIKE ? OR vendor LIKE ? OR domain LIKE ? OR capability LIKE ?)"
-            p.extend([f"%{search}%"]*4)
-        return [row_to_dict(r) for r in conn.execute(sql + " ORDER BY id", p).fetchall()]
+            ids, in_stack = _search_app_ids(search), cat.stack_matches(search)
+            pos = [i for i in pos if i in in_stack or cat.cols["id"][i] in ids]
+        return pos
+
+    def render() -> bytes:
+        pos = positions()[max(offset, 0):]   # page = slice ของตำแหน่ง แล้ว join JSON ที่ render ไว้แล้ว
+        if limit is not None: pos = pos[:max(limit, 0)]
+        return cat.project(pos, cols) if fields else ("[" + ",".join(cat.json[i] for i in pos) + "]").encode()
+
+    # ผลขึ้นกับ snapshot + query string อย่างเดียว → encode + บีบอัดครั้งเดียว แล้วใช้ซ้ำจนกว่าจะมีการเขียน
+    # ยกเว้นผลค้นหา (มาจาก FTS ไม่ใช่ snapshot) — encode สดทุกครั้ง ไม่เก็บ
+    key = None if search else tuple(sorted(request.query_params.multi_items()))
+    return _encoded_response(request, cat, key, render, headers)
+
+# CTE makes the planner resolve the FTS match first, then join back by rowid
+_APP_SEARCH_FTS_SQL  = ("WITH m AS (SELECT rowid FROM applications_fts WHERE applications_fts MATCH ?) "
+                        "SELECT a.id FROM applications a JOIN m ON a.rowid=m.rowid")
+_APP_SEARCH_LIKE_SQL = "SELECT id FROM applications WHERE name LIKE ? OR vendor LIKE ? OR domain LIKE ? OR capability LIKE ?"
+
+def _search_app_ids(search: str) -> set:
+    """ids matching the /api/apps free-text search (trigram FTS for 3+ chars, LIKE otherwise)."""
+    with get_db_ro() as conn:
+        if _FTS_ENABLED and len(search) >= 3:
+            rows = conn.execute(_APP_SEARCH_FTS_SQL, ('"' + search.replace('"', '""') + '"',))
+        else:
+            rows = conn.execute(_APP_SEARCH_LIKE_SQL, [f"%{search}%"]*4)
+        return {r[0] for r in rows}
+
+@app.get("/api/apps/summary")
+def r_apps_summary(request: Request, current_user: dict = Depends(_require_auth)):
+    """Counts by bcg/status/wave/ea_group/domain/criticality/stream, TCO by domain/stream, avg health by domain,
+    health histogram (index = health 0–100) — rendered to bytes once per snapshot."""
+    cat = app_catalog()
+    headers, not_modified = _catalog_cache_headers(request, cat)
+    if not_modified: return not_modified
+    return _encoded_response(request, cat, "summary",
+                             lambda: _json_dumps({k: v for k, v in cat.summary.items() if k != "ea_category"}), headers)
+
+@app.get("/api/apps/distinct/{col}")
+def r_apps_distinct(col: str, request: Request, show_decomm: bool = False,
+                    current_user: dict = Depends(_require_auth)):
+    """Sorted distinct values of one categorical column — built and encoded once per snapshot."""
+    if col not in _APP_INTERN_COLS: raise HTTPException(400, f"{col} is not a categorical column")
+    cat = app_catalog()
+    headers, not_modified = _catalog_cache_headers(request, cat)
+    if not_modified: return not_modified
+    return _encoded_response(request, cat, ("distinct", col, show_decomm),
+                             lambda: _json_dumps(cat.distinct(col, show_decomm)), headers)
 
 @app.get("/api/apps/{app_id}")
-def r_get(app_id: str, current_user: dict = Depends(_require_auth)):
-    with get_db() as conn:
-        row = conn.execute("SELECT * FROM applications WHERE id=?", (app_id,)).fetchone()
-    if not row: raise HTTPException(404, f"App {app_id} not found")
-    return row_to_dict(row)
+def r_get(app_id: str, request: Request, current_user: dict = Depends(_require_auth)):
+    # ส่ง JSON ที่ render ไว้แล้วใน snapshot ตรง ๆ — ไม่ต้อง build dict + encode ต่อ request
+    cat = app_catalog()
+    i = cat.pos_of.get(app_id)
+    if i is None: raise HTTPException(404, f"App {app_id} not found")
+    headers, not_modified = _catalog_cache_headers(request, cat)
+    return not_modified or Response(content=cat.json[i], media_type="application/json", headers=headers)
 
 @app.post("/api/apps", status_code=201)
 def r_create(body: AppWrite, request: Request, current_user: dict = Depends(_require_writer)):
     if not (body.name or "").strip(): raise HTTPException(400, "name is required")
-    with get_db() as conn:
+    with get_db(write=True) as conn:
         aid = next_id(conn)
         h, td = int(body.health or 75), int(body.tech_debt or (100 - int(body.health or 75)))
         conn.execute("""INSERT INTO applications VALUES (
@@ -3585,8 +4342,8 @@ def r_create(body: AppWrite, request: Request, current_user: dict = Depends(_req
             body.ea_group, body.ea_category, body.ea_sub_category or "-",
             datetime.now().strftime("%Y-%m-%d"),
         ))
-    _dump = getattr(body, "model_dump", None) or getattr(body, "dict")
-    after = _dump()
+    _bust_cache("ea_structure")
+    after = body.model_dump()
     risks = []
     if body.pi_spi: risks.append("PI_SPI_ENABLED")
     write_log(
@@ -3600,46 +4357,27 @@ def r_create(body: AppWrite, request: Request, current_user: dict = Depends(_req
 
 @app.put("/api/apps/{app_id}")
 def r_update(app_id: str, body: AppWrite, request: Request, current_user: dict = Depends(_require_writer)):
-    with get_db() as conn:
+    with get_db(write=True) as conn:
         row = conn.execute("SELECT * FROM applications WHERE id=?", (app_id,)).fetchone()
         if not row: raise HTTPException(404, f"App {app_id} not found")
         # BUG-02: ป้องกันการแก้ไข app ที่ถูก decommission แล้ว
         if row["decommissioned"]: raise HTTPException(400, "Cannot update a decommissioned application")
         before = row_to_dict(row)
-        c = dict(row)
-        # BUG-13: body.dict() deprecated ใน Pydantic v2 → ใช้ model_dump() พร้อม fallback
-        _dump = getattr(body, "model_dump", None) or getattr(body, "dict")
-        body_dict = _dump()
-        for k, v in body_dict.items():
-            if v is not None: c[k] = v
-        if body.stack is not None: c["stack"] = json.dumps(body.stack)
-        if body.compliance is not None: c["compliance"] = json.dumps(body.compliance)
-        h = int(c.get("health") or 75)
-        conn.execute("""UPDATE applications SET
-            name=?,domain=?,vendor=?,type=?,status=?,bcg=?,health=?,tech_debt=?,
-            age=?,tco=?,users=?,criticality=?,dr=?,eol=?,pi_spi=?,contract_end=?,
-            integration=?,stack=?,capability=?,strategic=?,persons=?,src_avail=?,
-            service_hour=?,maint_window=?,lang=?,os=?,db_platform=?,support=?,
-            owner=?,biz_owner=?,compliance=?,stream=?,approach=?,assess_status=?,assess_date=?,wave=?,
-            ea_group=?,ea_category=?,ea_sub_category=?,last_updated=? WHERE id=?""", (
-            c["name"],c.get("domain"),c.get("vendor"),c.get("type"),c.get("status"),c.get("bcg"),
-            h, int(c.get("tech_debt") or 100-h), int(c.get("age") or 0),
-            int(c.get("tco") or 0), int(c.get("users") or 0), c.get("criticality"),
-            int(c.get("dr") or False), c.get("eol"), int(c.get("pi_spi") or False),
-            c.get("contract_end"), int(c.get("integration") or 0),
-            c["stack"] if isinstance(c.get("stack"), str) else json.dumps(c.get("stack") or []),
-            c.get("capability"), int(c.get("strategic") or 70), int(c.get("persons") or 1),
-            int(c.get("src_avail") if c.get("src_avail") is not None else True),
-            c.get("service_hour"), c.get("maint_window"), c.get("lang"), c.get("os"),
-            c.get("db_platform"), c.get("support"), c.get("owner"), c.get("biz_owner"),
-            c["compliance"] if isinstance(c.get("compliance"), str) else json.dumps(c.get("compliance") or []),
-            c.get("stream"), c.get("approach"), c.get("assess_status"), c.get("assess_date"),
-            int(c.get("wave") or 3), c.get("ea_group"), c.get("ea_category"),
-            c.get("ea_sub_category") or "-",
-            datetime.now().strftime("%Y-%m-%d"), app_id,
-        ))
+        # เฉพาะ field ที่ client ส่งมาจริง — ส่ง null มาคือตั้งใจล้างค่า ไม่ใช่ "ไม่แก้"
+        body_dict = body.model_dump(exclude_unset=True)
+        if "name" in body_dict and not (body_dict["name"] or "").strip():
+            raise HTTPException(400, "name is required")
+        # UPDATE เฉพาะ column ที่ส่งมา — ค่า default เหมือนตอน INSERT
+        sets = {k: _APP_UPDATE_COERCE.get(k, _ident)(v) for k, v in body_dict.items() if k in _APP_UPDATABLE}
+        if "tech_debt" in sets or ("health" in sets and not row["tech_debt"]):
+            h = sets.get("health", row["health"]) or 75
+            sets["tech_debt"] = int(body_dict.get("tech_debt") or 100 - h)
+        sets["last_updated"] = datetime.now().strftime("%Y-%m-%d")
+        conn.execute(f"UPDATE applications SET {', '.join(k + '=?' for k in sets)} WHERE id=?",
+                     (*sets.values(), app_id))
+    _bust_cache("ea_structure")
     # Build after state and detect risks
-    after = {**before, **{k: v for k, v in body_dict.items() if v is not None}}
+    after = {**before, **body_dict}
     diff  = _diff_fields(before, after)
     risks = _detect_risks(before, after, body_dict)
     sev   = "WARNING" if risks else "INFO"
@@ -3661,7 +4399,7 @@ def r_update(app_id: str, body: AppWrite, request: Request, current_user: dict =
 
 @app.post("/api/apps/{app_id}/decommission")
 def r_decommission(app_id: str, body: DecommBody, request: Request, current_user: dict = Depends(_require_writer)):
-    with get_db() as conn:
+    with get_db(write=True) as conn:
         row = conn.execute("SELECT id, decommissioned, name, criticality FROM applications WHERE id=?", (app_id,)).fetchone()
         if not row: raise HTTPException(404, f"App {app_id} not found")
         if row["decommissioned"]: raise HTTPException(400, "Already decommissioned")
@@ -3669,6 +4407,7 @@ def r_decommission(app_id: str, body: DecommBody, request: Request, current_user
             decomm_date=?, decomm_reason=?, last_updated=? WHERE id=?""",
             (body.decomm_date, body.decomm_reason, datetime.now().strftime("%Y-%m-%d"), app_id))
 
+    _bust_cache("ea_structure")
     risks = ["MISSION_CRITICAL_DECOMMISSION"] if row["criticality"] == "Mission Critical" else []
 
     # CASCADE: update open vendor_engagements linked to this app
@@ -3713,7 +4452,7 @@ def r_restore(app_id: str, body: RestoreBody, request: Request, current_user: di
     allowed_statuses = {"Active", "Phase-out", "To-retire", "Planned"}
     if body.restore_status not in allowed_statuses:
         raise HTTPException(400, f"restore_status must be one of: {', '.join(sorted(allowed_statuses))}")
-    with get_db() as conn:
+    with get_db(write=True) as conn:
         row = conn.execute(
             "SELECT id, decommissioned, name, criticality, decomm_date, decomm_reason FROM applications WHERE id=?",
             (app_id,)).fetchone()
@@ -3723,6 +4462,7 @@ def r_restore(app_id: str, body: RestoreBody, request: Request, current_user: di
             SET decommissioned=0, status=?, decomm_date=NULL, decomm_reason=NULL, last_updated=?
             WHERE id=?""",
             (body.restore_status, datetime.now().strftime("%Y-%m-%d"), app_id))
+    _bust_cache("ea_structure")
     write_log(
         category="AUDIT", event_type="APP_RESTORE",
         severity="INFO",
@@ -3738,28 +4478,26 @@ def r_restore(app_id: str, body: RestoreBody, request: Request, current_user: di
 @app.get("/api/export")
 def r_export(include_decomm: bool = False, request: Request = None, current_user: dict = Depends(_require_auth)):
     """Export all apps as JSON — frontend converts to XLSX."""
-    with get_db() as conn:
-        sql = "SELECT * FROM applications"
-        if not include_decomm:
-            sql += " WHERE decommissioned=0"
-        sql += " ORDER BY id"
-        rows = conn.execute(sql).fetchall()
-    result = [row_to_dict(r) for r in rows]
+    cat = app_catalog()
+    pos = cat.select(include_decomm)
     # Count PI/SPI apps in export
-    pi_spi_count = sum(1 for r in result if r.get("pi_spi"))
+    pi_spi_count = len(cat.flagged(pos, pi_spi=True))
     risks = ["PI_SPI_DATA_EXPORT"] if pi_spi_count > 0 else []
     write_log(
         category="AUDIT", event_type="DATA_EXPORT",
         severity="WARNING" if risks else "INFO",
         actor_ip=(request.client.host if request and request.client else None),
         risk_flags=risks if risks else None,
-        extra={"app_count": len(result), "include_decomm": include_decomm, "pi_spi_count": pi_spi_count},
-        message=f"Exported {len(result)} apps (pi_spi={pi_spi_count})"
+        extra={"app_count": len(pos), "include_decomm": include_decomm, "pi_spi_count": pi_spi_count},
+        message=f"Exported {len(pos)} apps (pi_spi={pi_spi_count})"
     )
-    return result
+    # body เดียวกับ /api/apps แบบไม่กรอง → ใช้ bytes/gzip ที่ encode ไว้ต่อ snapshot (audit log ยังเขียนทุกครั้ง)
+    return _encoded_response(request, cat, ("export", include_decomm),
+                             lambda: ("[" + ",".join(cat.json[i] for i in pos) + "]").encode(), {})
 
 # ─── IMPORT ────────────────────────────────────────────────────────────────────
 class ImportApp(BaseModel):
+    model_config = ConfigDict(extra="ignore")
     id: Optional[str] = None
     name: Optional[str] = None
     domain: Optional[str] = None
@@ -3802,9 +4540,27 @@ class ImportApp(BaseModel):
     ea_sub_category: Optional[str] = None
 
 class ImportBody(BaseModel):
+    model_config = ConfigDict(extra="ignore")
     apps: List[ImportApp]
     mode: str = "upsert"   # "upsert" | "replace"
 
+# INSERT แถวใหม่ / UPDATE แถวเดิมใน statement เดียว — ไม่แตะ decommissioned / decomm_date / decomm_reason ของแถวเดิม
+APP_UPSERT_SQL = """INSERT INTO applications VALUES (
+    ?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,0,NULL,NULL,?)
+    ON CONFLICT(id) DO UPDATE SET
+    name=excluded.name,domain=excluded.domain,vendor=excluded.vendor,type=excluded.type,
+    status=excluded.status,bcg=excluded.bcg,health=excluded.health,tech_debt=excluded.tech_debt,
+    age=excluded.age,tco=excluded.tco,users=excluded.users,criticality=excluded.criticality,
+    dr=excluded.dr,eol=excluded.eol,pi_spi=excluded.pi_spi,contract_end=excluded.contract_end,
+    integration=excluded.integration,stack=excluded.stack,capability=excluded.capability,
+    strategic=excluded.strategic,persons=excluded.persons,src_avail=excluded.src_avail,
+    service_hour=excluded.service_hour,maint_window=excluded.maint_window,lang=excluded.lang,
+    os=excluded.os,db_platform=excluded.db_platform,support=excluded.support,owner=excluded.owner,
+    biz_owner=excluded.biz_owner,compliance=excluded.compliance,stream=excluded.stream,
+    approach=excluded.approach,assess_status=excluded.assess_status,assess_date=excluded.assess_date,
+    wave=excluded.wave,ea_group=excluded.ea_group,ea_category=excluded.ea_category,
+    ea_sub_category=excluded.ea_sub_category,last_updated=excluded.last_updated"""
+
 @app.post("/api/import")
 def r_import(body: ImportBody, request: Request = None, current_user: dict = Depends(_require_writer)):
     """
@@ -3829,60 +4585,69 @@ def r_import(body: ImportBody, request: Request = None, current_user: dict = Dep
     added = updated = 0
     today = datetime.now().strftime("%Y-%m-%d")
 
-    with get_db() as conn:
+    with get_db(write=True) as conn:
+        # ทั้ง import เป็น transaction เดียว — จอง write lock ตั้งแต่ต้น กัน importer สองตัวชน SQLITE_BUSY กลางทาง
+        conn.execute("BEGIN IMMEDIATE")
         # BUG-05: ลบหลังจากตรวจว่ามี valid records แน่แล้ว
         if body.mode == "replace":
             conn.execute("DELETE FROM applications")
+        ids = list(dict.fromkeys(a.id for a in valid_apps))
+        existing = {r[0] for r in conn.execute(
+            "SELECT id FROM applications WHERE id IN (SELECT value FROM json_each(?))", (json.dumps(ids),))}
 
+        params = []
         for a in valid_apps:
             try:
-                existing = conn.execute(
-                    "SELECT id FROM applications WHERE id=?", (a.id,)
-                ).fetchone()
-
                 h  = int(a.health or 75)
                 td = int(a.tech_debt if a.tech_debt is not None else 100 - h)
-
-                if existing:
-                    # UPDATE
-                    conn.execute("""UPDATE applications SET
-                        name=?,domain=?,vendor=?,type=?,status=?,bcg=?,health=?,tech_debt=?,
-                        age=?,tco=?,users=?,criticality=?,dr=?,eol=?,pi_spi=?,contract_end=?,
-                        integration=?,stack=?,capability=?,strategic=?,persons=?,src_avail=?,
-                        service_hour=?,maint_window=?,lang=?,os=?,db_platform=?,support=?,
-                        owner=?,biz_owner=?,compliance=?,stream=?,approach=?,assess_status=?,assess_date=?,wave=?,
-                        ea_group=?,ea_category=?,ea_sub_category=?,last_updated=? WHERE id=?""",
-                        (a.name,a.domain,a.vendor,a.type or "Package",a.status or "Active",
-                         a.bcg or "Tolerate",h,td,int(a.age or 0),int(a.tco or 0),int(a.users or 0),
-                         a.criticality or "Medium",int(a.dr or False),a.eol,
-                         int(a.pi_spi or False),a.contract_end,int(a.integration or 0),
-                         json.dumps(a.stack or []),a.capability,int(a.strategic or 70),
-                         int(a.persons or 1),int(a.src_avail if a.src_avail is not None else True),
-                         a.service_hour,a.maint_window,a.lang,a.os,a.db_platform,
-                         a.support,a.owner,a.biz_owner,json.dumps(a.compliance or []),
-                         a.stream,a.approach,a.assess_status,a.assess_date,
-                         int(a.wave or 3),a.ea_group,a.ea_category,a.ea_sub_category or "-",
-                         today, a.id))
-                    updated += 1
-                else:
-                    # INSERT
-                    conn.execute("""INSERT INTO applications VALUES (
-                        ?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,0,NULL,NULL,?)""",
-                        (a.id,a.name,a.domain,a.vendor,a.type or "Package",a.status or "Active",
-                         a.bcg or "Tolerate",h,td,int(a.age or 0),int(a.tco or 0),int(a.users or 0),
-                         a.criticality or "Medium",int(a.dr or False),a.eol,
-                         int(a.pi_spi or False),a.contract_end,int(a.integration or 0),
-                         json.dumps(a.stack or []),a.capability,int(a.strategic or 70),
-                         int(a.persons or 1),int(a.src_avail if a.src_avail is not None else True),
-                         a.service_hour,a.maint_window,a.lang,a.os,a.db_platform,
-                         a.support,a.owner,a.biz_owner,json.dumps(a.compliance or []),
-                         a.stream,a.approach,a.assess_status,a.assess_date,
-                         int(a.wave or 3),a.ea_group,a.ea_category,a.ea_sub_category or "-",today))
-                    added += 1
+                row = (a.id,a.name,a.domain,a.vendor,a.type or "Package",a.status or "Active",
+                     a.bcg or "Tolerate",h,td,int(a.age or 0),int(a.tco or 0),int(a.users or 0),
+                     a.criticality or "Medium",int(a.dr or False),a.eol,
+                     int(a.pi_spi or False),a.contract_end,int(a.integration or 0),
+                     json.dumps(a.stack or []),a.capability,int(a.strategic or 70),
+                     int(a.persons or 1),int(a.src_avail if a.src_avail is not None else True),
+                     a.service_hour,a.maint_window,a.lang,a.os,a.db_platform,
+                     a.support,a.owner,a.biz_owner,json.dumps(a.compliance or []),
+                     a.stream,a.approach,a.assess_status,a.assess_date,
+                     int(a.wave or 3),a.ea_group,a.ea_category,a.ea_sub_category or "-",today)
+                # SQLite INTEGER คือ 64-bit — ค่าที่เกินทำ executemany ทั้ง batch ล้ม (OverflowError) จึงตัดทิ้งตั้งแต่ตรงนี้
+                if any(type(v) is int and not -2**63 <= v < 2**63 for v in row):
+                    raise ValueError("integer out of range")
+                params.append(row)
             except Exception as ex:
                 errors += 1
                 print(f"  Import error {a.id}: {ex}")
 
+        # statement เดียว prepare ครั้งเดียว แล้ว bind ซ้ำทุกแถว — ถ้า SQLite ปฏิเสธแถวใด (constraint/trigger)
+        # ย้อน batch กลับถึง savepoint แล้วทำทีละแถว: แถวเสียนับเป็น errors ส่วนที่เหลือ import ต่อตามเดิม
+        conn.execute("SAVEPOINT import_batch")
+        try:
+            conn.executemany(APP_UPSERT_SQL, params)
+        except sqlite3.Error:
+            conn.execute("ROLLBACK TO import_batch")
+            ok = []
+            for p in params:
+                try:
+                    conn.execute(APP_UPSERT_SQL, p)
+                    ok.append(p)
+                except sqlite3.Error as ex:
+                    errors += 1
+                    print(f"  Import error {p[0]}: {ex}")
+            params = ok
+        conn.execute("RELEASE import_batch")
+        sync_app_counter(conn)
+        seen = set(existing)
+        for p in params:
+            if p[0] in seen:
+                updated += 1
+            else:
+                seen.add(p[0])
+                added += 1
+
+    # import ใหญ่ทำ WAL โต — checkpoint แบบไม่รอ reader หลัง commit
+    with get_db(write=True) as conn:
+        conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+    _bust_cache("ea_structure")
     write_log(
         category="AUDIT", event_type="DATA_IMPORT", severity="INFO",
         actor_ip=(request.client.host if request and request.client else None),
@@ -3894,7 +4659,11 @@ def r_import(body: ImportBody, request: Request = None, current_user: dict = Dep
 
 
 @app.get("/api/ea/structure")
-def r_ea_structure(current_user: dict = Depends(_require_auth)):
+def r_ea_structure(request: Request, current_user: dict = Depends(_require_auth)):
+    cat = app_catalog()
+    return _etag_response(request, "ea_structure", 10, lambda: _build_ea_structure(cat), cat.version)
+
+def _build_ea_structure(cat: AppCatalog) -> list:
     groups = [
         {"group":"1. Direction","color":"#7b61ff","categories":["1.1 BOD","1.2 Vision, Mission, Strategies","1.3 Goals, Objectives","1.4 Governance Body","1.5 Standard & Policies","1.6 Business Process & Services"]},
         {"group":"2. Services","color":"#00e5ff","categories":["2.1 Customer","2.2 Partner","2.3 Service","2.4 Employee","2.6 Channel","2.7 Portal & Gateway"]},
@@ -3902,11 +4671,9 @@ def r_ea_structure(current_user: dict = Depends(_require_auth)):
         {"group":"4. Support","color":"#ff9f43","categories":["4.1 Training & Communication","4.2 Corporate Information","4.3 Corporate Application & Information Technology"]},
         {"group":"5. Governance","color":"#ff4757","categories":["5.1 Corporate Security & Policy","5.2 Risk & Internal Control","5.3 Law & Compliance"]},
     ]
-    with get_db() as conn:
-        for g in groups:
-            g["counts"] = {c: conn.execute(
-                "SELECT COUNT(*) FROM applications WHERE ea_group=? AND ea_category=? AND decommissioned=0",
-                (g["group"], c)).fetchone()[0] for c in g["categories"]}
+    counts = cat.summary["ea_category"]
+    for g in groups:
+        g["counts"] = {c: counts.get((g["group"], c), 0) for c in g["categories"]}
     return groups
 
 # ─── VENDOR ENDPOINTS ──────────────────────────────────────────────────────────
@@ -4170,7 +4937,7 @@ def r_logs(
     for r in rows:
         d = dict(r)
         for f in ("before_state", "after_state", "risk_flags", "extra"):
-            try:    d[f] = json.loads(d[f]) if d.get(f) else None
+            try:    d[f] = _json_loads(d[f]) if d.get(f) else None
             except: d[f] = d.get(f)
         result.append(d)
     return {"logs": result, "total": total_row[0], "limit": limit, "offset": offset}
@@ -4340,17 +5107,14 @@ def r_app_full_profile(app_id: str, current_user: dict = Depends(_require_auth))
       audit.db    → recent audit trail (last 50 events)
     """
     # ── appport.db ─────────────────────────────────────────────────────────────
-    with get_db() as ac:
-        app_row = ac.execute(
-            "SELECT * FROM applications WHERE id=?", (app_id,)
-        ).fetchone()
-        if not app_row:
-            raise HTTPException(404, f"Application '{app_id}' not found")
-        app_data = dict(app_row)
-        # parse JSON columns
-        for col in ("stack", "compliance"):
-            try:    app_data[col] = json.loads(app_data[col]) if app_data.get(col) else []
-            except: pass
+    # record มาจาก snapshot — stack/compliance ถูก parse ไว้แล้วครั้งเดียวต่อ version
+    cat = app_catalog()
+    i = cat.pos_of.get(app_id)
+    if i is None:
+        raise HTTPException(404, f"Application '{app_id}' not found")
+    app_data = cat.row(i)._asdict()
+    app_data["stack"], app_data["compliance"] = list(cat.stacks[i]), list(cat.compliance[i])
+    with get_db_ro() as ac:
         # Projects linked to this app
         projects = [dict(r) for r in ac.execute("""
             SELECT p.id, p.name, p.status, p.health, p.priority,
@@ -4397,7 +5161,7 @@ def r_app_full_profile(app_id: str, current_user: dict = Depends(_require_auth))
         audit_history = []
         for r in audit_rows:
             d = dict(r)
-            try:    d["risk_flags"] = json.loads(d["risk_flags"]) if d.get("risk_flags") else None
+            try:    d["risk_flags"] = _json_loads(d["risk_flags"]) if d.get("risk_flags") else None
             except: pass
             audit_history.append(d)
 
@@ -5010,19 +5774,12 @@ def _auto_match_cve_apps():
             for tv in ea.execute("SELECT id,tech_id,cve_id,severity FROM tech_vulnerabilities WHERE cve_id IS NOT NULL AND cve_id!=''").fetchall():
                 vulns_by_tech.setdefault(tv["tech_id"], []).append(tv)
 
-        with get_db() as app_db:
-            apps = app_db.execute(
-                "SELECT id,stack,lang,os,db_platform FROM applications WHERE decommissioned=0"
-            ).fetchall()
-
+        cat = app_catalog()   # stack ถูก parse ไว้แล้วใน snapshot — ไม่ต้อง json.loads ต่อแถว
         with get_ea_domains_db() as ea:
-            for app in apps:
-                fields = []
-                try:
-                    fields += json.loads(app["stack"] or "[]")
-                except Exception:
-                    pass
-                for f in [app["lang"], app["os"], app["db_platform"]]:
+            for i in compress(range(cat.n), cat.active):
+                app = cat.row(i)
+                fields = list(cat.stacks[i])
+                for f in [app.lang, app.os, app.db_platform]:
                     if f: fields.append(f)
                 fields_lower = [f.lower() for f in fields if f]
                 for tech in techs:
@@ -5030,12 +5787,12 @@ def _auto_match_cve_apps():
                     if any(tname_lower in fl or fl in tname_lower for fl in fields_lower):
                         for tv in vulns_by_tech.get(tech["id"], []):
                             ex = ea.execute("SELECT 1 FROM cve_app_map WHERE cve_id=? AND app_id=?",
-                                            (tv["cve_id"], app["id"])).fetchone()
+                                            (tv["cve_id"], app.id)).fetchone()
                             if not ex:
                                 ea.execute("""INSERT INTO cve_app_map(id,cve_id,vuln_id,app_id,tech_id,tech_name,match_basis,severity,status)
                                               VALUES(?,?,?,?,?,?,?,?,?)""",
                                            ("CAM-"+uuid.uuid4().hex[:6].upper(), tv["cve_id"], tv["id"],
-                                            app["id"], tech["id"], tech["name"], "stack_keyword",
+                                            app.id, tech["id"], tech["name"], "stack_keyword",
                                             tv["severity"] or "Medium", "Open"))
                                 inserted += 1
             ea.commit()
@@ -6711,15 +7468,14 @@ def repo_catalog(
 
     # Applications
     if not obj_type or obj_type == "Application":
-        with get_db() as c:
-            rows = c.execute("SELECT id,name,domain,status,owner,criticality,type FROM applications WHERE decommissioned=0").fetchall()
-        for r in rows:
-            d = dict(r)
-            if not match(d["name"]): continue
-            if domain and d.get("domain","").lower() != domain.lower(): continue
-            if status and d.get("status","").lower() != status.lower(): continue
-            if owner and owner.lower() not in (d.get("owner","") or "").lower(): continue
-            results.append({**d, "object_type":"Application"})
+        # filter ใน SQLite (ใช้ partial index ของ applications) แทนการ scan ทั้งตารางใน Python
+        sql, p = "SELECT id,name,domain,status,owner,criticality,type FROM applications WHERE decommissioned=0", []
+        if q:      sql += " AND instr(lower(COALESCE(name,'')), ?) > 0";  p.append(q.lower())
+        if domain: sql += " AND lower(domain)=?";                         p.append(domain.lower())
+        if status: sql += " AND lower(status)=?";                         p.append(status.lower())
+        if owner:  sql += " AND instr(lower(COALESCE(owner,'')), ?) > 0"; p.append(owner.lower())
+        with get_db_ro() as c:
+            results.extend({**dict(r), "object_type":"Application"} for r in c.execute(sql, p))
 
     # Business Capabilities
     if not obj_type or obj_type == "BusinessCapability":
@@ -7631,7 +8387,7 @@ _EDGE_TYPES = ["hosts","uses","connects-to","calls","replicates-to",
 # ── helpers ──────────────────────────────────────────────────────────────────
 def _deploy_row_to_node(r) -> dict:
     d = dict(r)
-    try: d["tags"] = json.loads(d.get("tags") or "[]")
+    try: d["tags"] = _json_loads(d.get("tags") or "[]")
     except: d["tags"] = []
     return d
 
@@ -7806,11 +8562,34 @@ def api_deploy_edges_delete(edge_id: str, _u=Depends(_require_writer)):
 
 # ── END DEPLOYMENT TOPOLOGY ──────────────────────────────────────────────────
 
+class _CachedStaticFiles(StaticFiles):
+    """/assets with a browser cache lifetime — names aren't content-hashed (logo is user-replaceable),
+    so 1 day + the ETag/Last-Modified StaticFiles already sends, not immutable."""
+    def file_response(self, *args, **kwargs):
+        resp = super().file_response(*args, **kwargs)
+        resp.headers["Cache-Control"] = "public, max-age=86400"
+        return resp
+
 if os.path.isdir(STATIC_DIR):
-    app.mount("/assets", StaticFiles(directory=STATIC_DIR), name="assets")
+    app.mount("/assets", _CachedStaticFiles(directory=STATIC_DIR), name="assets")
+
+# [st_mtime_ns, bytes, gzip bytes or None] — index.html memoized, re-read when the file changes;
+# gzip (~1.4 MB → level 9 ครั้งเดียว) ทำตอนมี client ขอครั้งแรก แล้วใช้ซ้ำจนกว่าไฟล์จะเปลี่ยน
+_INDEX_CACHE: Optional[list] = None
+
+def _index_body(idx: str, coding: Optional[str]) -> bytes:
+    global _INDEX_CACHE
+    mtime = os.stat(idx).st_mtime_ns
+    entry = _INDEX_CACHE
+    if entry is None or entry[0] != mtime:
+        with open(idx, "rb") as f:
+            entry = _INDEX_CACHE = [mtime, f.read(), None]
+    if coding is None: return entry[1]
+    if entry[2] is None: entry[2] = gzip.compress(entry[1], 9, mtime=0)
+    return entry[2]
 
 @app.get("/{full_path:path}", include_in_schema=False)
-def catch_all(full_path: str = ""):
+def catch_all(request: Request, full_path: str = ""):
     # FIX #8: Block direct access to sensitive config / database files
     _BLOCKED_FILES = {
         "users.config.json", "mpx-studio.config.json",
@@ -7821,11 +8600,14 @@ def catch_all(full_path: str = ""):
     if full_path.startswith("api/"): raise HTTPException(404)
     idx = os.path.join(STATIC_DIR, "index.html")
     if os.path.exists(idx):
-        return FileResponse(idx, headers={
+        coding  = _negotiate_coding(request.headers.get("accept-encoding", ""), ("gzip",))
+        headers = {
             "Cache-Control": "no-cache, no-store, must-revalidate",
             "Pragma":        "no-cache",
             "Expires":       "0",
-        })
+        }
+        if coding: headers.update({"Content-Encoding": coding, "Vary": "Accept-Encoding"})
+        return Response(content=_index_body(idx, coding), media_type="text/html", headers=headers)
     return JSONResponse({"service": f"MPX AppPort EA Portfolio {APP_VERSION}", "docs": "/docs"})
 
 # ─── SEED DATA ─────────────────────────────────────────────────────────────────
@@ -7857,6 +8639,22 @@ def _assign_biz_owner(apps: list) -> list:
     return apps
 
 
+# keyword → compiled alternation: one C-level scan per field instead of a Python any() loop
+def _kw_re(words) -> re.Pattern:
+    return re.compile("|".join(map(re.escape, sorted(words))))
+
+_CLOUD_KW_RE     = _kw_re({"kubernetes","azure","aws","gcp","snowflake","heroku","terraform","kafka","cloud","istio","helm","docker","s3","lambda","fargate","bigquery"})
+_EVENT_KW_RE     = _kw_re({"kafka","rabbitmq","activemq","nats","eventbridge","pubsub","sqs","sns","mq","celery","redis streams"})
+_AI_KW_RE        = _kw_re({"tensorflow","pytorch","scikit","llm","gpt","openai","huggingface","langchain","ml","ai","vertex","sagemaker","mlflow","onnx","transformers"})
+_OT_KW_RE        = _kw_re({"scada","plc","ics","modbus","opc","dnp3","profibus","dcs","fieldbus","bacnet"})
+_WEB_KW_RE       = _kw_re({"react","angular","vue","next","nuxt","jquery","html","css","javascript","typescript","svelte","blazor"})
+_PAYMENT_KW_RE   = _kw_re({"payment","visa","mastercard","stripe","omise","promptpay","2c2p","paymentsense"})
+_BANKING_KW_RE   = _kw_re({"bank","banking","swift","sepa","clearing","settlement","iso20022","core bank","ledger","treasury","fx","nostro"})
+_TELCO_KW_RE     = _kw_re({"telco","telecom","billing","cdr","diameter","ss7","voip","4g","5g","ims","bss","oss"})
+_HEALTH_KW_RE    = _kw_re({"hl7","fhir","his","ehr","emr","hospital","clinic","patient","dicom","lab","pharmacy"})
+_IDENTITY_KW_RE  = _kw_re({"iam","sso","ldap","oauth","saml","oidc","identity","auth","pki","certificate","keycloak","okta","ping"})
+_DATA_KW_RE      = _kw_re({"warehouse","lake","catalog","mdm","etl","pipeline","olap","bi","dbt","airflow","spark","flink","databricks","superset","metabase"})
+
 def _assign_compliance(apps: list) -> list:
     """Assign deterministic compliance values based on each app's attributes.
     ใช้ fixed seed=42 → reproducible ทุก run — เพิ่ม standard ใหม่ใน COMPLIANCE_STANDARDS (index.html)
@@ -7864,18 +8662,6 @@ def _assign_compliance(apps: list) -> list:
     import random
     rng = random.Random(42)
 
-    CLOUD_KW    = {"kubernetes","azure","aws","gcp","snowflake","heroku","terraform","kafka","cloud","istio","helm","docker","s3","lambda","fargate","bigquery"}
-    EVENT_KW    = {"kafka","rabbitmq","activemq","nats","eventbridge","pubsub","sqs","sns","mq","celery","redis streams"}
-    AI_KW       = {"tensorflow","pytorch","scikit","llm","gpt","openai","huggingface","langchain","ml","ai","vertex","sagemaker","mlflow","onnx","transformers"}
-    OT_KW       = {"scada","plc","ics","modbus","opc","dnp3","profibus","dcs","fieldbus","bacnet"}
-    WEB_KW      = {"react","angular","vue","next","nuxt","jquery","html","css","javascript","typescript","svelte","blazor"}
-    PAYMENT_KW  = {"payment","visa","mastercard","stripe","omise","promptpay","2c2p","paymentsense"}
-    BANKING_KW  = {"bank","banking","swift","sepa","clearing","settlement","iso20022","core bank","ledger","treasury","fx","nostro"}
-    TELCO_KW    = {"telco","telecom","billing","cdr","diameter","ss7","voip","4g","5g","ims","bss","oss"}
-    HEALTH_KW   = {"hl7","fhir","his","ehr","emr","hospital","clinic","patient","dicom","lab","pharmacy"}
-    IDENTITY_KW = {"iam","sso","ldap","oauth","saml","oidc","identity","auth","pki","certificate","keycloak","okta","ping"}
-    DATA_KW     = {"warehouse","lake","catalog","mdm","etl","pipeline","olap","bi","dbt","airflow","spark","flink","databricks","superset","metabase"}
-
     for app in apps:
         stack  = (app.get("stack","") or "").lower()
         name   = (app.get("name","") or "").lower()
@@ -7890,17 +8676,17 @@ def _assign_compliance(apps: list) -> list:
 
         is_mc      = crit == "Mission Critical"
         is_high    = crit in ("Mission Critical","High")
-        is_cloud   = any(k in stack for k in CLOUD_KW)
-        is_event   = any(k in stack for k in EVENT_KW)
-        is_ai      = any(k in stack for k in AI_KW) or any(x in name for x in ("ai","ml","llm","genai","nlp"))
-        is_ot      = any(k in stack for k in OT_KW)
-        is_web     = any(k in stack for k in WEB_KW)
-        is_payment = any(k in name or k in domain for k in PAYMENT_KW)
-        is_banking = any(k in name or k in domain for k in BANKING_KW) or domain in ("finance","banking","treasury")
-        is_telco   = any(k in name or k in domain for k in TELCO_KW)
-        is_health  = any(k in name or k in domain for k in HEALTH_KW)
-        is_identity= any(k in name or k in domain for k in IDENTITY_KW)
-        is_data    = any(k in name or k in domain for k in DATA_KW) or domain in ("analytics","data","bi","reporting")
+        is_cloud   = bool(_CLOUD_KW_RE.search(stack))
+        is_event   = bool(_EVENT_KW_RE.search(stack))
+        is_ai      = bool(_AI_KW_RE.search(stack)) or any(x in name for x in ("ai","ml","llm","genai","nlp"))
+        is_ot      = bool(_OT_KW_RE.search(stack))
+        is_web     = bool(_WEB_KW_RE.search(stack))
+        is_payment = bool(_PAYMENT_KW_RE.search(name) or _PAYMENT_KW_RE.search(domain))
+        is_banking = bool(_BANKING_KW_RE.search(name) or _BANKING_KW_RE.search(domain)) or domain in ("finance","banking","treasury")
+        is_telco   = bool(_TELCO_KW_RE.search(name) or _TELCO_KW_RE.search(domain))
+        is_health  = bool(_HEALTH_KW_RE.search(name) or _HEALTH_KW_RE.search(domain))
+        is_identity= bool(_IDENTITY_KW_RE.search(name) or _IDENTITY_KW_RE.search(domain))
+        is_data    = bool(_DATA_KW_RE.search(name) or _DATA_KW_RE.search(domain)) or domain in ("analytics","data","bi","reporting")
         is_inhouse = atype in ("Inhouse",)
         is_saas    = atype in ("Package","SaaS") and is_cloud
         has_pii    = bool(app.get("pi_spi"))
@@ -7995,109 +8781,20 @@ def _assign_compliance(apps: list) -> list:
             app["compliance"] = "[]"
     return apps
 
+@functools.lru_cache(maxsize=1)
+def _seed_app_rows() -> tuple:
+    """Seed apps with biz_owner + compliance assigned, ready for named binding — built once per process.
+    Treat the result as read-only (it is shared between callers)."""
+    rows = _seed_apps()
+    rows = _assign_biz_owner(rows)    # assign Business App Owner name ตาม domain
+    rows = _assign_compliance(rows)   # random compliance จาก attributes ของแต่ละ app
+    # ensure every seed dict has required keys for named binding
+    return tuple({**r, "biz_owner": r.get("biz_owner"), "compliance": r.get("compliance", "[]")} for r in rows)
+
 def _seed_apps() -> list:
-    return [
-        {"id":'APP-001',"name":'SAP S/4HANA',"domain":'Finance',"vendor":'SAP',"type":'Package',"status":'Active',"bcg":'Invest',"health":88,"tech_debt":12,"age":3,"tco":4200,"users":850,"criticality":'Mission Critical',"dr":1,"eol":'2032-12',"pi_spi":1,"contract_end":'2027-06',"integration":12,"stack":'["ABAP", "SAP UI5", "HANA"]',"capability":'ERP Core',"strategic":92,"persons":8,"src_avail":1,"service_hour":'24x7',"maint_window":'Sun 02:00-06:00',"lang":'ABAP',"os":'SUSE Linux',"db_platform":'SAP HANA',"support":'Vendor+Inhouse',"owner":'Somchai K.',"stream":'Core Finance',"approach":'Upgrade',"assess_status":'Completed',"assess_date":'2024-06',"wave":1,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-002',"name":'Salesforce CRM',"domain":'CRM',"vendor":'Salesforce',"type":'Package',"status":'Active',"bcg":'Invest',"health":85,"tech_debt":15,"age":4,"tco":2800,"users":420,"criticality":'Mission Critical',"dr":1,"eol":'2030-12',"pi_spi":1,"contract_end":'2026-03',"integration":18,"stack":'["Apex", "Lightning", "Heroku"]',"capability":'CRM',"strategic":88,"persons":5,"src_avail":0,"service_hour":'24x7',"maint_window":'Sat 23:00-03:00',"lang":'Apex/JS',"os":'Cloud (SaaS)',"db_platform":'Salesforce DB',"support":'Vendor',"owner":'Narong P.',"stream":'Customer Experience',"approach":'Migrate',"assess_status":'Completed',"assess_date":'2024-09',"wave":2,"ea_group":'2. Services',"ea_category":'2.1 Customer',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-003',"name":'Core Banking AS/400',"domain":'Finance',"vendor":'IBM',"type":'Inhouse',"status":'Phase-out',"bcg":'Retire',"health":35,"tech_debt":82,"age":22,"tco":6500,"users":120,"criticality":'Mission Critical',"dr":0,"eol":'2025-12',"pi_spi":1,"contract_end":'2025-12',"integration":35,"stack":'["RPG", "COBOL", "DB2"]',"capability":'Core Banking',"strategic":15,"persons":2,"src_avail":1,"service_hour":'24x7',"maint_window":'Sun 01:00-05:00',"lang":'RPG/COBOL',"os":'IBM i (AS/400)',"db_platform":'DB2/400',"support":'Inhouse',"owner":'Wanchai S.',"stream":'Core Banking Transform',"approach":'Replace',"assess_status":'Completed',"assess_date":'2023-12',"wave":1,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-004',"name":'HR WorkDay',"domain":'HR',"vendor":'Workday',"type":'Package',"status":'Active',"bcg":'Invest',"health":90,"tech_debt":8,"age":2,"tco":1800,"users":1200,"criticality":'High',"dr":1,"eol":'2033-06',"pi_spi":1,"contract_end":'2028-01',"integration":8,"stack":'["Workday Studio", "REST API"]',"capability":'HR Management',"strategic":85,"persons":4,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Workday Studio',"os":'Cloud (SaaS)',"db_platform":'Workday DB',"support":'Vendor',"owner":'Pitchaya N.',"stream":'HR Modernization',"approach":'Extend',"assess_status":'Planned',"assess_date":'2025-03',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-005',"name":'AI Analytics Hub',"domain":'Analytics',"vendor":'Internal',"type":'Inhouse',"status":'Active',"bcg":'Grow',"health":78,"tech_debt":22,"age":1,"tco":950,"users":280,"criticality":'High',"dr":1,"eol":'2029-06',"pi_spi":0,"contract_end":'N/A',"integration":14,"stack":'["Python", "TensorFlow", "Kubernetes"]',"capability":'Analytics & AI',"strategic":95,"persons":6,"src_avail":1,"service_hour":'Business Hours',"maint_window":'Sat 20:00-24:00',"lang":'Python',"os":'Linux (K8s)',"db_platform":'PostgreSQL',"support":'Inhouse',"owner":'Thanakrit W.',"stream":'Data & AI',"approach":'Grow',"assess_status":'In Progress',"assess_date":'2025-01',"wave":2,"ea_group":'4. Support',"ea_category":'4.2 Corporate Information',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-006',"name":'Legacy ERP Oracle',"domain":'Finance',"vendor":'Oracle',"type":'Package',"status":'Phase-out',"bcg":'Retire',"health":42,"tech_debt":75,"age":18,"tco":5200,"users":95,"criticality":'High',"dr":0,"eol":'2026-06',"pi_spi":1,"contract_end":'2026-06',"integration":28,"stack":'["Oracle Forms", "PL/SQL"]',"capability":'ERP Core',"strategic":20,"persons":3,"src_avail":1,"service_hour":'Business Hours',"maint_window":'Sun 02:00-08:00',"lang":'PL/SQL',"os":'Oracle Linux',"db_platform":'Oracle 11g',"support":'Vendor',"owner":'Amorn C.',"stream":'Core Finance',"approach":'Retire',"assess_status":'Completed',"assess_date":'2023-06',"wave":1,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-007',"name":'K8s Platform',"domain":'Infrastructure',"vendor":'Internal',"type":'Inhouse',"status":'Active',"bcg":'Invest',"health":92,"tech_debt":6,"age":2,"tco":1200,"users":45,"criticality":'Mission Critical',"dr":1,"eol":'2030-06',"pi_spi":0,"contract_end":'N/A',"integration":30,"stack":'["Kubernetes", "Helm", "Terraform"]',"capability":'Cloud Platform',"strategic":90,"persons":5,"src_avail":1,"service_hour":'24x7',"maint_window":'Tue 02:00-04:00',"lang":'YAML/HCL',"os":'Linux (Ubuntu)',"db_platform":'etcd',"support":'Inhouse',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-11',"wave":1,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-008',"name":'Data Warehouse v2',"domain":'Analytics',"vendor":'Snowflake',"type":'Package',"status":'Active',"bcg":'Grow',"health":82,"tech_debt":18,"age":3,"tco":1600,"users":180,"criticality":'High',"dr":1,"eol":'2031-12',"pi_spi":0,"contract_end":'2027-09',"integration":22,"stack":'["Snowflake", "dbt", "Airflow"]',"capability":'Data Platform',"strategic":87,"persons":4,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 01:00-05:00',"lang":'SQL/Python',"os":'Cloud (SaaS)',"db_platform":'Snowflake',"support":'Vendor+Inhouse',"owner":'Charoenporn V.',"stream":'Data & AI',"approach":'Grow',"assess_status":'Completed',"assess_date":'2024-08',"wave":2,"ea_group":'4. Support',"ea_category":'4.2 Corporate Information',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-009',"name":'Supply Chain SAP',"domain":'Supply Chain',"vendor":'SAP',"type":'Package',"status":'Active',"bcg":'Invest',"health":80,"tech_debt":20,"age":5,"tco":3100,"users":340,"criticality":'Mission Critical',"dr":1,"eol":'2031-06',"pi_spi":1,"contract_end":'2027-06',"integration":16,"stack":'["ABAP", "SAP SCM", "HANA"]',"capability":'Supply Chain',"strategic":86,"persons":7,"src_avail":1,"service_hour":'24x7',"maint_window":'Sun 02:00-06:00',"lang":'ABAP',"os":'SUSE Linux',"db_platform":'SAP HANA',"support":'Vendor+Inhouse',"owner":'Sirichai B.',"stream":'Supply Chain',"approach":'Upgrade',"assess_status":'In Progress',"assess_date":'2024-12',"wave":1,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-010',"name":'Customer Portal',"domain":'Customer',"vendor":'Internal',"type":'Inhouse',"status":'Active',"bcg":'Grow',"health":75,"tech_debt":28,"age":4,"tco":800,"users":50000,"criticality":'High',"dr":1,"eol":'2029-06',"pi_spi":1,"contract_end":'N/A',"integration":12,"stack":'["React", "Node.js", "PostgreSQL"]',"capability":'Customer Self-Service',"strategic":82,"persons":6,"src_avail":1,"service_hour":'24x7',"maint_window":'Mon 02:00-04:00',"lang":'JavaScript',"os":'Linux (K8s)',"db_platform":'PostgreSQL',"support":'Inhouse',"owner":'Worapon S.',"stream":'Customer Experience',"approach":'Modernize',"assess_status":'Planned',"assess_date":'2025-02',"wave":2,"ea_group":'2. Services',"ea_category":'2.7 Portal & Gateway',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-011',"name":'Legacy CRM Siebel',"domain":'CRM',"vendor":'Oracle',"type":'Package',"status":'To-retire',"bcg":'Retire',"health":28,"tech_debt":90,"age":20,"tco":3800,"users":65,"criticality":'High',"dr":0,"eol":'2025-06',"pi_spi":1,"contract_end":'2025-06',"integration":24,"stack":'["Siebel", "PL/SQL"]',"capability":'CRM',"strategic":8,"persons":1,"src_avail":0,"service_hour":'Business Hours',"maint_window":'N/A',"lang":'Siebel VB',"os":'Windows Server',"db_platform":'Oracle 10g',"support":'Vendor',"owner":'Teerayut K.',"stream":'Customer Experience',"approach":'Retire',"assess_status":'Completed',"assess_date":'2024-01',"wave":1,"ea_group":'2. Services',"ea_category":'2.1 Customer',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-012',"name":'Azure DevOps',"domain":'Infrastructure',"vendor":'Microsoft',"type":'Package',"status":'Active',"bcg":'Invest',"health":88,"tech_debt":10,"age":3,"tco":420,"users":220,"criticality":'Medium',"dr":1,"eol":'2032-12',"pi_spi":0,"contract_end":'2026-12',"integration":15,"stack":'["Azure", "Git", "YAML"]',"capability":'DevOps',"strategic":78,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'YAML',"os":'Cloud (SaaS)',"db_platform":'Azure SQL',"support":'Vendor',"owner":'Nuntachai P.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Not Started',"assess_date":'',"wave":2,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-013',"name":'Power BI Platform',"domain":'Analytics',"vendor":'Microsoft',"type":'Package',"status":'Active',"bcg":'Grow',"health":83,"tech_debt":14,"age":3,"tco":680,"users":520,"criticality":'Medium',"dr":0,"eol":'2032-12',"pi_spi":0,"contract_end":'2026-12',"integration":10,"stack":'["Power BI", "DAX", "Azure"]',"capability":'BI & Reporting',"strategic":80,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'DAX/M',"os":'Cloud (SaaS)',"db_platform":'Power BI Premium',"support":'Vendor',"owner":'Orawan L.',"stream":'Data & AI',"approach":'Grow',"assess_status":'In Progress',"assess_date":'2025-01',"wave":3,"ea_group":'4. Support',"ea_category":'4.2 Corporate Information',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-014',"name":'MES Factory v1',"domain":'Operations',"vendor":'Rockwell',"type":'Package',"status":'Phase-out',"bcg":'Tolerate',"health":55,"tech_debt":60,"age":12,"tco":2200,"users":80,"criticality":'Mission Critical',"dr":0,"eol":'2027-06',"pi_spi":0,"contract_end":'2027-06',"integration":6,"stack":'["FactoryTalk", "Historian"]',"capability":'Manufacturing',"strategic":42,"persons":3,"src_avail":0,"service_hour":'24x7',"maint_window":'Sun 04:00-06:00',"lang":'Proprietary',"os":'Windows Server 2012',"db_platform":'SQL Server 2012',"support":'Vendor',"owner":'Patipan W.',"stream":'Operations',"approach":'Replace',"assess_status":'Planned',"assess_date":'2025-06',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-015',"name":'Treasury System',"domain":'Finance',"vendor":'FIS',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":68,"tech_debt":38,"age":9,"tco":1500,"users":35,"criticality":'Mission Critical',"dr":1,"eol":'2028-06',"pi_spi":1,"contract_end":'2028-06',"integration":14,"stack":'["FIS Integrity", "SQL Server"]',"capability":'Treasury',"strategic":65,"persons":4,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 23:00-03:00',"lang":'C#/.NET',"os":'Windows Server',"db_platform":'SQL Server',"support":'Vendor',"owner":'Nipon A.',"stream":'Core Finance',"approach":'Upgrade',"assess_status":'Completed',"assess_date":'2024-04',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-016',"name":'Identity Platform',"domain":'Security',"vendor":'Okta',"type":'Package',"status":'Active',"bcg":'Invest',"health":94,"tech_debt":5,"age":2,"tco":560,"users":5000,"criticality":'Mission Critical',"dr":1,"eol":'2033-12',"pi_spi":1,"contract_end":'2027-03',"integration":45,"stack":'["Okta", "SAML", "OAuth2"]',"capability":'Identity & Access',"strategic":92,"persons":3,"src_avail":0,"service_hour":'24x7',"maint_window":'Wed 02:00-04:00',"lang":'N/A (SaaS)',"os":'Cloud (SaaS)',"db_platform":'Okta DB',"support":'Vendor',"owner":'Kanchana R.',"stream":'Security',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-10',"wave":1,"ea_group":'2. Services',"ea_category":'2.1 Customer',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-017',"name":'ITSM ServiceNow',"domain":'Operations',"vendor":'ServiceNow',"type":'Package',"status":'Active',"bcg":'Invest',"health":86,"tech_debt":12,"age":4,"tco":1100,"users":350,"criticality":'High',"dr":1,"eol":'2032-06',"pi_spi":0,"contract_end":'2027-09',"integration":20,"stack":'["ServiceNow", "JavaScript", "Glide"]',"capability":'IT Service Mgmt',"strategic":84,"persons":5,"src_avail":0,"service_hour":'24x7',"maint_window":'Sat 22:00-02:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'ServiceNow DB',"support":'Vendor+Inhouse',"owner":'Prasertsak D.',"stream":'IT Operations',"approach":'Extend',"assess_status":'Completed',"assess_date":'2024-07',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-018',"name":'Batch Processing v2',"domain":'Operations',"vendor":'Internal',"type":'Inhouse',"status":'Active',"bcg":'Tolerate',"health":62,"tech_debt":45,"age":8,"tco":380,"users":5,"criticality":'High',"dr":0,"eol":'2027-12',"pi_spi":0,"contract_end":'N/A',"integration":8,"stack":'["Java", "Spring", "Oracle"]',"capability":'Batch Ops',"strategic":50,"persons":2,"src_avail":1,"service_hour":'Off-Hours',"maint_window":'Daily 00:00-04:00',"lang":'Java',"os":'RHEL 7',"db_platform":'Oracle 12c',"support":'Inhouse',"owner":'Phanuwat S.',"stream":'Operations',"approach":'Modernize',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-019',"name":'Document Mgmt',"domain":'Operations',"vendor":'OpenText',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":65,"tech_debt":42,"age":10,"tco":920,"users":450,"criticality":'Medium',"dr":0,"eol":'2026-12',"pi_spi":1,"contract_end":'2026-12',"integration":12,"stack":'["OpenText", "Documentum"]',"capability":'Document Mgmt',"strategic":55,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'Java',"os":'Windows Server',"db_platform":'SQL Server',"support":'Vendor',"owner":'Apinya T.',"stream":'Operations',"approach":'Replace',"assess_status":'In Progress',"assess_date":'2024-11',"wave":3,"ea_group":'2. Services',"ea_category":'2.6 Channel',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-020',"name":'API Gateway',"domain":'Infrastructure',"vendor":'Kong',"type":'Package',"status":'Active',"bcg":'Invest',"health":90,"tech_debt":8,"age":2,"tco":320,"users":20,"criticality":'Mission Critical',"dr":1,"eol":'2031-06',"pi_spi":0,"contract_end":'2027-06',"integration":60,"stack":'["Kong", "Kubernetes", "Lua"]',"capability":'Integration',"strategic":88,"persons":4,"src_avail":0,"service_hour":'24x7',"maint_window":'Tue 02:00-04:00',"lang":'Lua/Go',"os":'Linux (K8s)',"db_platform":'PostgreSQL',"support":'Vendor+Inhouse',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-09',"wave":1,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-021',"name":'Legacy Payroll RPG',"domain":'HR',"vendor":'Internal',"type":'Inhouse',"status":'To-retire',"bcg":'Retire',"health":30,"tech_debt":88,"age":25,"tco":1800,"users":12,"criticality":'High',"dr":0,"eol":'2025-12',"pi_spi":1,"contract_end":'N/A',"integration":5,"stack":'["RPG", "ILE", "DB2/400"]',"capability":'Payroll',"strategic":5,"persons":1,"src_avail":1,"service_hour":'Off-Hours',"maint_window":'N/A',"lang":'RPG/ILE',"os":'IBM i (AS/400)',"db_platform":'DB2/400',"support":'Inhouse',"owner":'Wanchai S.',"stream":'HR Modernization',"approach":'Retire',"assess_status":'Completed',"assess_date":'2023-09',"wave":1,"ea_group":'2. Services',"ea_category":'2.3 Service',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-022',"name":'e-Commerce Platform',"domain":'Customer',"vendor":'Commercetools',"type":'Package',"status":'Active',"bcg":'Invest',"health":87,"tech_debt":14,"age":2,"tco":2200,"users":200000,"criticality":'Mission Critical',"dr":1,"eol":'2031-12',"pi_spi":1,"contract_end":'2027-12',"integration":25,"stack":'["Commercetools", "React", "GraphQL"]',"capability":'e-Commerce',"strategic":94,"persons":8,"src_avail":0,"service_hour":'24x7',"maint_window":'Mon 02:00-04:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'MongoDB/SaaS',"support":'Vendor+Inhouse',"owner":'Varunya C.',"stream":'Customer Experience',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-10',"wave":2,"ea_group":'1. Direction',"ea_category":'1.5 Standard & Policies',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-023',"name":'Risk Mgmt System',"domain":'Finance',"vendor":"Moody's","type":'Package',"status":'Active',"bcg":'Tolerate',"health":70,"tech_debt":32,"age":7,"tco":1400,"users":45,"criticality":'High',"dr":1,"eol":'2029-06',"pi_spi":1,"contract_end":'2029-06',"integration":10,"stack":'["Moody\'s RMS", "Oracle"]',"capability":'Risk Management',"strategic":70,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Java',"os":'Oracle Linux',"db_platform":'Oracle 19c',"support":'Vendor',"owner":'Nipon A.',"stream":'Core Finance',"approach":'Upgrade',"assess_status":'Planned',"assess_date":'2025-04',"wave":3,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-024',"name":'ML Feature Store',"domain":'Analytics',"vendor":'Internal',"type":'Inhouse',"status":'Active',"bcg":'Grow',"health":76,"tech_debt":24,"age":1,"tco":480,"users":30,"criticality":'Medium',"dr":0,"eol":'2030-06',"pi_spi":0,"contract_end":'N/A',"integration":8,"stack":'["Python", "Redis", "PostgreSQL"]',"capability":'ML Platform',"strategic":90,"persons":4,"src_avail":1,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Python',"os":'Linux (K8s)',"db_platform":'Redis/PostgreSQL',"support":'Inhouse',"owner":'Thanakrit W.',"stream":'Data & AI',"approach":'Grow',"assess_status":'In Progress',"assess_date":'2025-02',"wave":2,"ea_group":'2. Services',"ea_category":'2.4 Employee',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-025',"name":'EAM - Maximo',"domain":'Operations',"vendor":'IBM',"type":'Package',"status":'Phase-out',"bcg":'Tolerate',"health":58,"tech_debt":55,"age":14,"tco":2600,"users":95,"criticality":'High',"dr":0,"eol":'2027-06',"pi_spi":0,"contract_end":'2027-06',"integration":9,"stack":'["IBM Maximo", "Java EE", "Db2"]',"capability":'Asset Management',"strategic":48,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'Java EE',"os":'AIX',"db_platform":'IBM Db2',"support":'Vendor',"owner":'Patipan W.',"stream":'Operations',"approach":'Replace',"assess_status":'Completed',"assess_date":'2023-10',"wave":2,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-026',"name":'Cloud MDM',"domain":'Analytics',"vendor":'Reltio',"type":'Package',"status":'Active',"bcg":'Grow',"health":80,"tech_debt":18,"age":2,"tco":760,"users":60,"criticality":'Medium',"dr":1,"eol":'2030-06',"pi_spi":1,"contract_end":'2027-06',"integration":18,"stack":'["Reltio", "REST", "Kafka"]',"capability":'Master Data',"strategic":82,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Java',"os":'Cloud (SaaS)',"db_platform":'Reltio Graph DB',"support":'Vendor',"owner":'Charoenporn V.',"stream":'Data & AI',"approach":'Grow',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-027',"name":'Network IPAM',"domain":'Infrastructure',"vendor":'Infoblox',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":72,"tech_debt":28,"age":6,"tco":280,"users":8,"criticality":'Mission Critical',"dr":1,"eol":'2029-12',"pi_spi":0,"contract_end":'2027-12',"integration":4,"stack":'["Infoblox", "REST", "DNS"]',"capability":'Network Mgmt',"strategic":60,"persons":2,"src_avail":0,"service_hour":'24x7',"maint_window":'Thu 02:00-04:00',"lang":'N/A (Appliance)',"os":'Infoblox OS',"db_platform":'Infoblox DB',"support":'Vendor',"owner":'Nuntachai P.',"stream":'IT Operations',"approach":'Upgrade',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'2. Services',"ea_category":'2.2 Partner',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-028',"name":'Old BI Crystal',"domain":'Analytics',"vendor":'SAP',"type":'Package',"status":'To-retire',"bcg":'Retire',"health":22,"tech_debt":92,"age":19,"tco":980,"users":30,"criticality":'Low',"dr":0,"eol":'2025-06',"pi_spi":0,"contract_end":'2025-06',"integration":5,"stack":'["Crystal Reports", "SAP BO"]',"capability":'BI & Reporting',"strategic":5,"persons":1,"src_avail":0,"service_hour":'Business Hours',"maint_window":'N/A',"lang":'Crystal Syntax',"os":'Windows Server',"db_platform":'SQL Server 2008',"support":'Vendor',"owner":'Orawan L.',"stream":'Data & AI',"approach":'Retire',"assess_status":'Completed',"assess_date":'2023-08',"wave":1,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-029',"name":'ServiceMesh Istio',"domain":'Infrastructure',"vendor":'Internal',"type":'Inhouse',"status":'Active',"bcg":'Invest',"health":85,"tech_debt":12,"age":2,"tco":180,"users":12,"criticality":'Mission Critical',"dr":1,"eol":'2031-06',"pi_spi":0,"contract_end":'N/A',"integration":40,"stack":'["Istio", "Kubernetes", "Envoy"]',"capability":'Cloud Platform',"strategic":86,"persons":4,"src_avail":1,"service_hour":'24x7',"maint_window":'Tue 02:00-04:00',"lang":'YAML/Go',"os":'Linux (K8s)',"db_platform":'N/A',"support":'Inhouse',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-11',"wave":1,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-030',"name":'Procurement Ariba',"domain":'Supply Chain',"vendor":'SAP',"type":'Package',"status":'Active',"bcg":'Invest',"health":84,"tech_debt":14,"age":3,"tco":1200,"users":160,"criticality":'High',"dr":1,"eol":'2030-12',"pi_spi":1,"contract_end":'2027-06',"integration":12,"stack":'["SAP Ariba", "REST", "XML"]',"capability":'Procurement',"strategic":80,"persons":4,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'SAP HANA',"support":'Vendor',"owner":'Sirichai B.',"stream":'Supply Chain',"approach":'Extend',"assess_status":'Completed',"assess_date":'2024-06',"wave":2,"ea_group":'2. Services',"ea_category":'2.7 Portal & Gateway',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-031',"name":'Contact Center CX',"domain":'Customer',"vendor":'Genesys',"type":'Package',"status":'Active',"bcg":'Invest',"health":82,"tech_debt":16,"age":3,"tco":1850,"users":280,"criticality":'High',"dr":1,"eol":'2031-12',"pi_spi":1,"contract_end":'2027-12',"integration":14,"stack":'["Genesys Cloud", "WebRTC", "REST"]',"capability":'Contact Center',"strategic":85,"persons":5,"src_avail":0,"service_hour":'24x7',"maint_window":'Mon 02:00-04:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'Genesys DB',"support":'Vendor',"owner":'Varunya C.',"stream":'Customer Experience',"approach":'Extend',"assess_status":'In Progress',"assess_date":'2024-12',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-032',"name":'Cyber SIEM',"domain":'Security',"vendor":'Splunk',"type":'Package',"status":'Active',"bcg":'Invest',"health":88,"tech_debt":10,"age":3,"tco":890,"users":15,"criticality":'Mission Critical',"dr":1,"eol":'2030-12',"pi_spi":0,"contract_end":'2026-12',"integration":50,"stack":'["Splunk", "Python", "REST"]',"capability":'Security Ops',"strategic":92,"persons":4,"src_avail":0,"service_hour":'24x7',"maint_window":'Wed 02:00-04:00',"lang":'SPL/Python',"os":'Linux',"db_platform":'Splunk Index',"support":'Vendor+Inhouse',"owner":'Kanchana R.',"stream":'Security',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-09',"wave":1,"ea_group":'4. Support',"ea_category":'4.2 Corporate Information',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-033',"name":'Finance Close',"domain":'Finance',"vendor":'BlackLine',"type":'Package',"status":'Active',"bcg":'Grow',"health":81,"tech_debt":17,"age":2,"tco":680,"users":85,"criticality":'High',"dr":1,"eol":'2031-06',"pi_spi":1,"contract_end":'2027-06',"integration":8,"stack":'["BlackLine", "REST", "SAP"]',"capability":'Financial Close',"strategic":78,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'BlackLine DB',"support":'Vendor',"owner":'Amorn C.',"stream":'Core Finance',"approach":'Grow',"assess_status":'Planned',"assess_date":'2025-05',"wave":3,"ea_group":'1. Direction',"ea_category":'1.6 Business Process & Services',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-034',"name":'WMS Warehouse',"domain":'Supply Chain',"vendor":'Manhattan',"type":'Package',"status":'Phase-out',"bcg":'Tolerate',"health":60,"tech_debt":50,"age":11,"tco":1700,"users":120,"criticality":'High',"dr":0,"eol":'2027-12',"pi_spi":0,"contract_end":'2027-12',"integration":10,"stack":'["Manhattan WMS", "SQL Server"]',"capability":'Warehouse Ops',"strategic":52,"persons":3,"src_avail":0,"service_hour":'24x7',"maint_window":'Sun 02:00-06:00',"lang":'Java',"os":'Windows Server',"db_platform":'SQL Server 2016',"support":'Vendor',"owner":'Sirichai B.',"stream":'Supply Chain',"approach":'Replace',"assess_status":'In Progress',"assess_date":'2024-10',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-035',"name":'IoT Data Platform',"domain":'Operations',"vendor":'Internal',"type":'Inhouse',"status":'Active',"bcg":'Grow',"health":74,"tech_debt":26,"age":2,"tco":520,"users":18,"criticality":'Medium',"dr":0,"eol":'2030-06',"pi_spi":0,"contract_end":'N/A',"integration":22,"stack":'["MQTT", "Kafka", "TimescaleDB"]',"capability":'IoT',"strategic":88,"persons":4,"src_avail":1,"service_hour":'24x7',"maint_window":'Mon 02:00-04:00',"lang":'Python/Go',"os":'Linux (K8s)',"db_platform":'TimescaleDB',"support":'Inhouse',"owner":'Phanuwat S.',"stream":'Operations',"approach":'Grow',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'2. Services',"ea_category":'2.3 Service',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-036',"name":'Compliance GRC',"domain":'Security',"vendor":'ServiceNow',"type":'Package',"status":'Active',"bcg":'Invest',"health":86,"tech_debt":12,"age":2,"tco":580,"users":60,"criticality":'High',"dr":1,"eol":'2031-06',"pi_spi":1,"contract_end":'2027-09',"integration":15,"stack":'["ServiceNow GRC", "REST"]',"capability":'Compliance',"strategic":85,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'ServiceNow DB',"support":'Vendor',"owner":'Prasertsak D.',"stream":'Security',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-08',"wave":1,"ea_group":'4. Support',"ea_category":'4.1 Training & Communication',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-037',"name":'Legacy GL Batch',"domain":'Finance',"vendor":'Internal',"type":'Inhouse',"status":'To-retire',"bcg":'Retire',"health":25,"tech_debt":95,"age":28,"tco":1200,"users":8,"criticality":'High',"dr":0,"eol":'2025-09',"pi_spi":1,"contract_end":'N/A',"integration":7,"stack":'["COBOL", "JCL", "z/OS"]',"capability":'General Ledger',"strategic":4,"persons":1,"src_avail":1,"service_hour":'Off-Hours',"maint_window":'N/A',"lang":'COBOL',"os":'IBM z/OS',"db_platform":'VSAM/EBCDIC',"support":'Inhouse',"owner":'Wanchai S.',"stream":'Core Finance',"approach":'Retire',"assess_status":'Completed',"assess_date":'2023-06',"wave":1,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-038',"name":'Chat & Collab',"domain":'HR',"vendor":'Microsoft',"type":'Package',"status":'Active',"bcg":'Invest',"health":92,"tech_debt":6,"age":3,"tco":340,"users":4500,"criticality":'Medium',"dr":1,"eol":'2033-12',"pi_spi":0,"contract_end":'2026-12',"integration":20,"stack":'["Teams", "Azure AD", "Graph API"]',"capability":'Collaboration',"strategic":80,"persons":2,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'N/A (SaaS)',"os":'Cloud (SaaS)',"db_platform":'Microsoft 365',"support":'Vendor',"owner":'Pitchaya N.',"stream":'HR Modernization',"approach":'Extend',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'5. Governance',"ea_category":'5.2 Risk & Internal Control',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-039',"name":'Legacy EDI Hub',"domain":'Supply Chain',"vendor":'Internal',"type":'Inhouse',"status":'Phase-out',"bcg":'Tolerate',"health":50,"tech_debt":68,"age":16,"tco":780,"users":6,"criticality":'High',"dr":0,"eol":'2026-12',"pi_spi":0,"contract_end":'N/A',"integration":42,"stack":'["EDI X12", "VAN", "COBOL"]',"capability":'B2B Integration',"strategic":38,"persons":2,"src_avail":1,"service_hour":'24x7',"maint_window":'Daily 02:00-03:00',"lang":'COBOL',"os":'IBM i',"db_platform":'DB2/400',"support":'Inhouse',"owner":'Wanchai S.',"stream":'Supply Chain',"approach":'Replace',"assess_status":'In Progress',"assess_date":'2024-11',"wave":2,"ea_group":'2. Services',"ea_category":'2.4 Employee',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-040',"name":'RPA Platform',"domain":'Operations',"vendor":'UiPath',"type":'Package',"status":'Active',"bcg":'Grow',"health":79,"tech_debt":20,"age":2,"tco":420,"users":25,"criticality":'Medium',"dr":0,"eol":'2030-06',"pi_spi":0,"contract_end":'2027-06',"integration":28,"stack":'["UiPath", "RPA", "Python"]',"capability":'Process Automation',"strategic":84,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 20:00-24:00',"lang":'UiPath Studio',"os":'Windows',"db_platform":'SQL Server',"support":'Vendor',"owner":'Patipan W.',"stream":'Operations',"approach":'Grow',"assess_status":'Planned',"assess_date":'2025-03',"wave":3,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-041',"name":'PLM Windchill',"domain":'Operations',"vendor":'PTC',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":66,"tech_debt":40,"age":9,"tco":1400,"users":95,"criticality":'High',"dr":0,"eol":'2028-06',"pi_spi":0,"contract_end":'2028-06',"integration":8,"stack":'["PTC Windchill", "Java EE", "Oracle"]',"capability":'PLM',"strategic":60,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'Java EE',"os":'Windows Server',"db_platform":'Oracle 19c',"support":'Vendor',"owner":'Patipan W.',"stream":'Operations',"approach":'Upgrade',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'2. Services',"ea_category":'2.1 Customer',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-042',"name":'Catalog PIM',"domain":'Customer',"vendor":'Akeneo',"type":'Package',"status":'Active',"bcg":'Grow',"health":82,"tech_debt":16,"age":2,"tco":360,"users":45,"criticality":'Medium',"dr":0,"eol":'2030-12',"pi_spi":0,"contract_end":'2027-12',"integration":16,"stack":'["Akeneo", "REST", "GraphQL"]',"capability":'Product Catalog',"strategic":82,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'PHP',"os":'Cloud (SaaS)',"db_platform":'Akeneo DB',"support":'Vendor',"owner":'Varunya C.',"stream":'Customer Experience',"approach":'Grow',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-043',"name":'CDP Customer Data',"domain":'Customer',"vendor":'Segment',"type":'Package',"status":'Active',"bcg":'Invest',"health":84,"tech_debt":14,"age":2,"tco":680,"users":35,"criticality":'High',"dr":1,"eol":'2031-06',"pi_spi":1,"contract_end":'2027-06',"integration":30,"stack":'["Segment", "Kafka", "React"]',"capability":'Customer Data',"strategic":90,"persons":4,"src_avail":0,"service_hour":'24x7',"maint_window":'Mon 02:00-04:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'Segment DB',"support":'Vendor',"owner":'Worapon S.',"stream":'Customer Experience',"approach":'Invest',"assess_status":'In Progress',"assess_date":'2024-12',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-044',"name":'Tax Engine',"domain":'Finance',"vendor":'Vertex',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":72,"tech_debt":30,"age":6,"tco":420,"users":20,"criticality":'High',"dr":0,"eol":'2028-12',"pi_spi":1,"contract_end":'2028-12',"integration":8,"stack":'["Vertex", "REST", "SAP"]',"capability":'Tax',"strategic":65,"persons":2,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Java',"os":'Cloud (SaaS)',"db_platform":'Vertex DB',"support":'Vendor',"owner":'Amorn C.',"stream":'Core Finance',"approach":'Upgrade',"assess_status":'Planned',"assess_date":'2025-06',"wave":3,"ea_group":'5. Governance',"ea_category":'5.1 Corporate Security & Policy',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-045',"name":'Monitoring Observ.',"domain":'Infrastructure',"vendor":'Datadog',"type":'Package',"status":'Active',"bcg":'Invest',"health":90,"tech_debt":8,"age":2,"tco":580,"users":35,"criticality":'Mission Critical',"dr":1,"eol":'2031-12',"pi_spi":0,"contract_end":'2026-12',"integration":35,"stack":'["Datadog", "APM", "Terraform"]',"capability":'Observability',"strategic":88,"persons":3,"src_avail":0,"service_hour":'24x7',"maint_window":'Thu 02:00-04:00',"lang":'N/A (SaaS)',"os":'Cloud (SaaS)',"db_platform":'Datadog TSDB',"support":'Vendor+Inhouse',"owner":'Nuttapon T.',"stream":'IT Operations',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-09',"wave":1,"ea_group":'2. Services',"ea_category":'2.6 Channel',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-046',"name":'Old Asset AS/400',"domain":'Operations',"vendor":'IBM',"type":'Inhouse',"status":'To-retire',"bcg":'Retire',"health":20,"tech_debt":96,"age":30,"tco":950,"users":5,"criticality":'Medium',"dr":0,"eol":'2025-06',"pi_spi":0,"contract_end":'N/A',"integration":3,"stack":'["RPG", "AS/400", "DB2/400"]',"capability":'Asset Management',"strategic":2,"persons":1,"src_avail":1,"service_hour":'Business Hours',"maint_window":'N/A',"lang":'RPG',"os":'IBM i',"db_platform":'DB2/400',"support":'Inhouse',"owner":'Wanchai S.',"stream":'Operations',"approach":'Retire',"assess_status":'Completed',"assess_date":'2023-06',"wave":1,"ea_group":'4. Support',"ea_category":'4.2 Corporate Information',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-047',"name":'Demand Planning',"domain":'Supply Chain',"vendor":'Kinaxis',"type":'Package',"status":'Active',"bcg":'Invest',"health":85,"tech_debt":13,"age":3,"tco":1100,"users":65,"criticality":'High',"dr":1,"eol":'2031-06',"pi_spi":0,"contract_end":'2027-06',"integration":14,"stack":'["Kinaxis RapidResponse", "REST"]',"capability":'Demand Planning',"strategic":84,"persons":4,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'Kinaxis DB',"support":'Vendor',"owner":'Sirichai B.',"stream":'Supply Chain',"approach":'Invest',"assess_status":'Planned',"assess_date":'2025-04',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-048',"name":'Fraud Detection AI',"domain":'Security',"vendor":'Internal',"type":'Inhouse',"status":'Active',"bcg":'Grow',"health":80,"tech_debt":20,"age":1,"tco":680,"users":8,"criticality":'Mission Critical',"dr":1,"eol":'2030-12',"pi_spi":1,"contract_end":'N/A',"integration":12,"stack":'["Python", "TensorFlow", "Kafka"]',"capability":'Fraud Detection',"strategic":94,"persons":5,"src_avail":1,"service_hour":'24x7',"maint_window":'Mon 02:00-04:00',"lang":'Python',"os":'Linux (K8s)',"db_platform":'Kafka/PostgreSQL',"support":'Inhouse',"owner":'Kanchana R.',"stream":'Security',"approach":'Grow',"assess_status":'In Progress',"assess_date":'2025-01',"wave":2,"ea_group":'1. Direction',"ea_category":'1.4 Governance Body',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-049',"name":'Content Mgmt CMS',"domain":'Customer',"vendor":'Contentful',"type":'Package',"status":'Active',"bcg":'Grow',"health":82,"tech_debt":16,"age":2,"tco":280,"users":30,"criticality":'Low',"dr":0,"eol":'2030-12',"pi_spi":0,"contract_end":'2027-12',"integration":10,"stack":'["Contentful", "GraphQL", "CDN"]',"capability":'Content Mgmt',"strategic":75,"persons":2,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'Contentful DB',"support":'Vendor',"owner":'Worapon S.',"stream":'Customer Experience',"approach":'Grow',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'2. Services',"ea_category":'2.7 Portal & Gateway',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-050',"name":'Gen-AI Copilot',"domain":'Digital',"vendor":'Internal',"type":'Inhouse',"status":'Planned',"bcg":'Grow',"health":70,"tech_debt":25,"age":0,"tco":520,"users":0,"criticality":'Medium',"dr":0,"eol":'2032-06',"pi_spi":0,"contract_end":'N/A',"integration":5,"stack":'["GPT-4", "LangChain", "Azure"]',"capability":'AI Assistant',"strategic":96,"persons":6,"src_avail":1,"service_hour":'Business Hours',"maint_window":'N/A',"lang":'Python',"os":'Azure Cloud',"db_platform":'Azure CosmosDB',"support":'Inhouse',"owner":'Thanakrit W.',"stream":'Data & AI',"approach":'Build',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-051',"name":'Oracle HCM Cloud',"domain":'HR',"vendor":'Oracle',"type":'Package',"status":'Active',"bcg":'Invest',"health":86,"tech_debt":11,"age":3,"tco":2200,"users":950,"criticality":'High',"dr":1,"eol":'2033-12',"pi_spi":1,"contract_end":'2028-06',"integration":9,"stack":'["Oracle HCM", "REST API", "OIC"]',"capability":'HR Management',"strategic":84,"persons":4,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Groovy/JS',"os":'Cloud (SaaS)',"db_platform":'Oracle DB',"support":'Vendor',"owner":'Pitchaya N.',"stream":'HR Modernization',"approach":'Extend',"assess_status":'Planned',"assess_date":'2025-04',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-052',"name":'ServiceNow ITSM',"domain":'Infrastructure',"vendor":'ServiceNow',"type":'Package',"status":'Active',"bcg":'Invest',"health":91,"tech_debt":7,"age":4,"tco":1800,"users":680,"criticality":'High',"dr":1,"eol":'2032-06',"pi_spi":0,"contract_end":'2027-06',"integration":20,"stack":'["ServiceNow", "JavaScript", "REST"]',"capability":'IT Service Mgmt',"strategic":88,"persons":3,"src_avail":0,"service_hour":'24x7',"maint_window":'Sun 02:00-06:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'ServiceNow DB',"support":'Vendor',"owner":'Nuntachai P.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-10',"wave":2,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-053',"name":'Maximo EAM',"domain":'Operations',"vendor":'IBM',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":62,"tech_debt":42,"age":11,"tco":2600,"users":210,"criticality":'High',"dr":1,"eol":'2028-06',"pi_spi":0,"contract_end":'2028-06',"integration":8,"stack":'["Maximo", "Java", "DB2"]',"capability":'Asset Management',"strategic":60,"persons":4,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 03:00-07:00',"lang":'Java',"os":'AIX',"db_platform":'DB2',"support":'Vendor+Inhouse',"owner":'Patipan W.',"stream":'Operations',"approach":'Modernize',"assess_status":'In Progress',"assess_date":'2024-07',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-054',"name":'Tableau Analytics',"domain":'Analytics',"vendor":'Salesforce',"type":'Package',"status":'Active',"bcg":'Grow',"health":84,"tech_debt":12,"age":3,"tco":720,"users":390,"criticality":'Medium',"dr":0,"eol":'2031-12',"pi_spi":0,"contract_end":'2027-01',"integration":12,"stack":'["Tableau", "REST API", "Python"]',"capability":'Visual Analytics',"strategic":81,"persons":2,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-24:00',"lang":'VizQL',"os":'Cloud (SaaS)',"db_platform":'Tableau DB',"support":'Vendor',"owner":'Orawan L.',"stream":'Data & AI',"approach":'Grow',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'4. Support',"ea_category":'4.2 Corporate Information',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-055',"name":'Pega BPM',"domain":'Operations',"vendor":'Pegasystems',"type":'Package',"status":'Active',"bcg":'Grow',"health":79,"tech_debt":21,"age":5,"tco":1900,"users":320,"criticality":'High',"dr":1,"eol":'2030-06',"pi_spi":1,"contract_end":'2027-12',"integration":16,"stack":'["Pega", "Java", "React"]',"capability":'Business Process Mgmt',"strategic":79,"persons":5,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'Java/Pega',"os":'Linux',"db_platform":'PostgreSQL',"support":'Vendor+Inhouse',"owner":'Sirichai B.',"stream":'Operations',"approach":'Extend',"assess_status":'Planned',"assess_date":'2025-05',"wave":2,"ea_group":'1. Direction',"ea_category":'1.6 Business Process & Services',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-056',"name":'SAP Ariba',"domain":'Supply Chain',"vendor":'SAP',"type":'Package',"status":'Active',"bcg":'Invest',"health":83,"tech_debt":14,"age":4,"tco":1600,"users":180,"criticality":'High',"dr":1,"eol":'2031-12',"pi_spi":1,"contract_end":'2027-06',"integration":11,"stack":'["SAP Ariba", "REST", "ABAP"]',"capability":'Procurement',"strategic":85,"persons":4,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 23:00-03:00',"lang":'ABAP/JS',"os":'Cloud (SaaS)',"db_platform":'SAP HANA',"support":'Vendor',"owner":'Sirichai B.',"stream":'Supply Chain',"approach":'Upgrade',"assess_status":'Completed',"assess_date":'2024-09',"wave":1,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-057',"name":'Splunk SIEM',"domain":'Security',"vendor":'Splunk',"type":'Package',"status":'Active',"bcg":'Invest',"health":88,"tech_debt":10,"age":3,"tco":1400,"users":40,"criticality":'Mission Critical',"dr":1,"eol":'2031-06',"pi_spi":0,"contract_end":'2026-12',"integration":25,"stack":'["Splunk", "Python", "REST"]',"capability":'Security Monitoring',"strategic":92,"persons":4,"src_avail":0,"service_hour":'24x7',"maint_window":'Tue 03:00-05:00',"lang":'SPL/Python',"os":'Linux',"db_platform":'Splunk Index',"support":'Vendor+Inhouse',"owner":'Nuntachai P.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-11',"wave":1,"ea_group":'5. Governance',"ea_category":'5.1 Corporate Security & Policy',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-058',"name":'Mulesoft ESB',"domain":'Infrastructure',"vendor":'Salesforce',"type":'Package',"status":'Active',"bcg":'Invest',"health":85,"tech_debt":13,"age":4,"tco":2100,"users":25,"criticality":'Mission Critical',"dr":1,"eol":'2031-12',"pi_spi":0,"contract_end":'2027-06',"integration":48,"stack":'["Mulesoft", "REST", "SOAP", "Kafka"]',"capability":'Integration Platform',"strategic":90,"persons":5,"src_avail":0,"service_hour":'24x7',"maint_window":'Wed 03:00-05:00',"lang":'DataWeave',"os":'Cloud (SaaS)',"db_platform":'MySQL',"support":'Vendor+Inhouse',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-06',"wave":1,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-059',"name":'WMS Manhattan',"domain":'Supply Chain',"vendor":'Manhattan',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":68,"tech_debt":38,"age":9,"tco":2400,"users":160,"criticality":'High',"dr":1,"eol":'2028-12',"pi_spi":0,"contract_end":'2028-12',"integration":7,"stack":'["Manhattan WMS", "Java", "Oracle"]',"capability":'Warehouse Mgmt',"strategic":62,"persons":4,"src_avail":0,"service_hour":'24x7',"maint_window":'Sun 04:00-08:00',"lang":'Java',"os":'Windows Server',"db_platform":'Oracle 12c',"support":'Vendor',"owner":'Sirichai B.',"stream":'Supply Chain',"approach":'Replace',"assess_status":'Planned',"assess_date":'2025-06',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-060',"name":'Adobe Experience Mgr',"domain":'Digital',"vendor":'Adobe',"type":'Package',"status":'Active',"bcg":'Grow',"health":80,"tech_debt":20,"age":4,"tco":1300,"users":55,"criticality":'Medium',"dr":0,"eol":'2031-06',"pi_spi":0,"contract_end":'2027-03',"integration":9,"stack":'["AEM", "Java", "HTL"]',"capability":'Digital Experience',"strategic":78,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Java/HTL',"os":'Cloud (SaaS)',"db_platform":'JCR/MongoDB',"support":'Vendor+Inhouse',"owner":'Worapon S.',"stream":'Customer Experience',"approach":'Grow',"assess_status":'In Progress',"assess_date":'2025-01',"wave":3,"ea_group":'2. Services',"ea_category":'2.7 Portal & Gateway',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-061',"name":'KRONOS WFM',"domain":'HR',"vendor":'UKG',"type":'Package',"status":'Phase-out',"bcg":'Tolerate',"health":52,"tech_debt":55,"age":12,"tco":1100,"users":800,"criticality":'High',"dr":0,"eol":'2026-06',"pi_spi":0,"contract_end":'2026-06',"integration":5,"stack":'["KRONOS", "Java", "SQL Server"]',"capability":'Workforce Mgmt',"strategic":38,"persons":2,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 03:00-07:00',"lang":'Java',"os":'Windows Server 2016',"db_platform":'SQL Server 2014',"support":'Vendor',"owner":'Pitchaya N.',"stream":'HR Modernization',"approach":'Replace',"assess_status":'Completed',"assess_date":'2024-02',"wave":1,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-062',"name":'Coupa Spend Mgmt',"domain":'Finance',"vendor":'Coupa',"type":'Package',"status":'Active',"bcg":'Grow',"health":87,"tech_debt":11,"age":2,"tco":860,"users":240,"criticality":'Medium',"dr":0,"eol":'2032-12',"pi_spi":0,"contract_end":'2027-06',"integration":7,"stack":'["Coupa", "REST API", "OAuth"]',"capability":'Spend Management',"strategic":76,"persons":2,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'Coupa DB',"support":'Vendor',"owner":'Amorn C.',"stream":'Core Finance',"approach":'Grow',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-063',"name":'SAP TM Transport',"domain":'Supply Chain',"vendor":'SAP',"type":'Package',"status":'Active',"bcg":'Invest',"health":81,"tech_debt":17,"age":5,"tco":1700,"users":90,"criticality":'High',"dr":1,"eol":'2031-06',"pi_spi":0,"contract_end":'2027-06',"integration":8,"stack":'["SAP TM", "ABAP", "HANA"]',"capability":'Transport Mgmt',"strategic":82,"persons":4,"src_avail":1,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'ABAP',"os":'SUSE Linux',"db_platform":'SAP HANA',"support":'Vendor+Inhouse',"owner":'Sirichai B.',"stream":'Supply Chain',"approach":'Upgrade',"assess_status":'Planned',"assess_date":'2025-04',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-064',"name":'Veeva Vault QMS',"domain":'Operations',"vendor":'Veeva',"type":'Package',"status":'Active',"bcg":'Invest',"health":89,"tech_debt":9,"age":2,"tco":1100,"users":120,"criticality":'High',"dr":1,"eol":'2033-06',"pi_spi":1,"contract_end":'2027-12',"integration":6,"stack":'["Veeva Vault", "REST", "Java"]',"capability":'Quality Mgmt',"strategic":86,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Java/JS',"os":'Cloud (SaaS)',"db_platform":'Veeva DB',"support":'Vendor',"owner":'Patipan W.',"stream":'Operations',"approach":'Extend',"assess_status":'Completed',"assess_date":'2024-08',"wave":2,"ea_group":'5. Governance',"ea_category":'5.2 Risk & Internal Control',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-065',"name":'PingFederate IAM',"domain":'Security',"vendor":'Ping Identity',"type":'Package',"status":'Active',"bcg":'Invest',"health":90,"tech_debt":8,"age":3,"tco":950,"users":2500,"criticality":'Mission Critical',"dr":1,"eol":'2032-12',"pi_spi":0,"contract_end":'2026-09',"integration":32,"stack":'["PingFederate", "OAuth", "SAML"]',"capability":'Identity & Access',"strategic":94,"persons":4,"src_avail":0,"service_hour":'24x7',"maint_window":'Wed 02:00-04:00',"lang":'Java',"os":'Linux',"db_platform":'PostgreSQL',"support":'Vendor+Inhouse',"owner":'Nuntachai P.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-10',"wave":1,"ea_group":'5. Governance',"ea_category":'5.1 Corporate Security & Policy',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-066',"name":'Informatica MDM',"domain":'Analytics',"vendor":'Informatica',"type":'Package',"status":'Active',"bcg":'Grow',"health":76,"tech_debt":26,"age":6,"tco":1400,"users":35,"criticality":'High',"dr":1,"eol":'2030-12',"pi_spi":0,"contract_end":'2028-06',"integration":18,"stack":'["Informatica", "Java", "Oracle"]',"capability":'Master Data Mgmt',"strategic":83,"persons":4,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'Java',"os":'Linux',"db_platform":'Oracle 19c',"support":'Vendor+Inhouse',"owner":'Charoenporn V.',"stream":'Data & AI',"approach":'Modernize',"assess_status":'In Progress',"assess_date":'2024-12',"wave":2,"ea_group":'4. Support',"ea_category":'4.2 Corporate Information',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-067',"name":'DocuSign eSign',"domain":'Finance',"vendor":'DocuSign',"type":'Package',"status":'Active',"bcg":'Grow',"health":92,"tech_debt":6,"age":2,"tco":340,"users":600,"criticality":'Medium',"dr":0,"eol":'2033-12',"pi_spi":1,"contract_end":'2027-03',"integration":8,"stack":'["DocuSign", "REST", "OAuth"]',"capability":'Digital Signature',"strategic":74,"persons":1,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-24:00',"lang":'REST API',"os":'Cloud (SaaS)',"db_platform":'DocuSign DB',"support":'Vendor',"owner":'Amorn C.',"stream":'Core Finance',"approach":'Extend',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-068',"name":'Zabbix Monitoring',"domain":'Infrastructure',"vendor":'Internal',"type":'Inhouse',"status":'Active',"bcg":'Tolerate',"health":70,"tech_debt":32,"age":7,"tco":180,"users":30,"criticality":'High',"dr":1,"eol":'2027-12',"pi_spi":0,"contract_end":'N/A',"integration":40,"stack":'["Zabbix", "PHP", "MySQL"]',"capability":'Infrastructure Monitoring',"strategic":65,"persons":2,"src_avail":1,"service_hour":'24x7',"maint_window":'Thu 02:00-04:00',"lang":'PHP',"os":'Linux (Ubuntu)',"db_platform":'MySQL',"support":'Inhouse',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Replace',"assess_status":'Planned',"assess_date":'2025-03',"wave":2,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-069',"name":'Confluence Wiki',"domain":'Infrastructure',"vendor":'Atlassian',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":73,"tech_debt":28,"age":6,"tco":210,"users":780,"criticality":'Low',"dr":0,"eol":'2028-12',"pi_spi":0,"contract_end":'2026-12',"integration":6,"stack":'["Confluence", "Java", "REST"]',"capability":'Knowledge Mgmt',"strategic":55,"persons":2,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Java',"os":'Cloud (SaaS)',"db_platform":'PostgreSQL',"support":'Vendor',"owner":'Nuntachai P.',"stream":'Platform Modernization',"approach":'Modernize',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'4. Support',"ea_category":'4.1 Training & Communication',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-070',"name":'Jira Service Desk',"domain":'Infrastructure',"vendor":'Atlassian',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":75,"tech_debt":25,"age":5,"tco":280,"users":920,"criticality":'Medium',"dr":0,"eol":'2029-12',"pi_spi":0,"contract_end":'2026-12',"integration":10,"stack":'["Jira", "REST", "Python"]',"capability":'Service Desk',"strategic":58,"persons":2,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Java',"os":'Cloud (SaaS)',"db_platform":'PostgreSQL',"support":'Vendor',"owner":'Nuntachai P.',"stream":'Platform Modernization',"approach":'Modernize',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-071',"name":'SAP GRC Access',"domain":'Security',"vendor":'SAP',"type":'Package',"status":'Active',"bcg":'Invest',"health":84,"tech_debt":14,"age":5,"tco":980,"users":150,"criticality":'High',"dr":1,"eol":'2031-06',"pi_spi":1,"contract_end":'2027-06',"integration":7,"stack":'["SAP GRC", "ABAP", "HANA"]',"capability":'GRC & Compliance',"strategic":88,"persons":3,"src_avail":1,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'ABAP',"os":'SUSE Linux',"db_platform":'SAP HANA',"support":'Vendor+Inhouse',"owner":'Nuntachai P.',"stream":'Core Finance',"approach":'Upgrade',"assess_status":'Completed',"assess_date":'2024-07',"wave":1,"ea_group":'5. Governance',"ea_category":'5.3 Law & Compliance',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-072',"name":'OpenShift Platform',"domain":'Infrastructure',"vendor":'Red Hat',"type":'Package',"status":'Active',"bcg":'Invest',"health":90,"tech_debt":8,"age":2,"tco":1600,"users":60,"criticality":'Mission Critical',"dr":1,"eol":'2032-06',"pi_spi":0,"contract_end":'2027-06',"integration":35,"stack":'["OpenShift", "Kubernetes", "Helm"]',"capability":'Container Platform',"strategic":92,"persons":5,"src_avail":0,"service_hour":'24x7',"maint_window":'Tue 02:00-04:00',"lang":'YAML/Ansible',"os":'RHEL',"db_platform":'etcd',"support":'Vendor+Inhouse',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-11',"wave":1,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-073',"name":'Guidewire Claims',"domain":'Operations',"vendor":'Guidewire',"type":'Package',"status":'Active',"bcg":'Invest',"health":87,"tech_debt":11,"age":3,"tco":3200,"users":440,"criticality":'Mission Critical',"dr":1,"eol":'2032-12',"pi_spi":1,"contract_end":'2028-06',"integration":14,"stack":'["Guidewire", "Java", "Gosu"]',"capability":'Claims Processing',"strategic":90,"persons":6,"src_avail":0,"service_hour":'24x7',"maint_window":'Sun 02:00-06:00',"lang":'Gosu/Java',"os":'Linux',"db_platform":'Oracle 19c',"support":'Vendor+Inhouse',"owner":'Somchai K.',"stream":'Core Banking Transform',"approach":'Extend',"assess_status":'Completed',"assess_date":'2024-09',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-074',"name":'Dynatrace APM',"domain":'Infrastructure',"vendor":'Dynatrace',"type":'Package',"status":'Active',"bcg":'Grow',"health":91,"tech_debt":7,"age":2,"tco":860,"users":50,"criticality":'High',"dr":1,"eol":'2032-12',"pi_spi":0,"contract_end":'2027-06',"integration":28,"stack":'["Dynatrace", "OneAgent", "REST"]',"capability":'Application Performance',"strategic":85,"persons":2,"src_avail":0,"service_hour":'24x7',"maint_window":'Thu 03:00-05:00',"lang":'OneAgent',"os":'Cloud (SaaS)',"db_platform":'Dynatrace DB',"support":'Vendor',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Grow',"assess_status":'In Progress',"assess_date":'2025-01',"wave":2,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-075',"name":'SWIFT Gateway',"domain":'Finance',"vendor":'SWIFT',"type":'Package',"status":'Active',"bcg":'Invest',"health":88,"tech_debt":10,"age":6,"tco":2800,"users":15,"criticality":'Mission Critical',"dr":1,"eol":'2030-06',"pi_spi":1,"contract_end":'2028-06',"integration":22,"stack":'["SWIFT", "FIN", "ISO 20022"]',"capability":'Payment Gateway',"strategic":95,"persons":5,"src_avail":0,"service_hour":'24x7',"maint_window":'Sun 01:00-05:00',"lang":'C++/Java',"os":'RHEL',"db_platform":'Oracle 19c',"support":'Vendor+Inhouse',"owner":'Somchai K.',"stream":'Core Finance',"approach":'Upgrade',"assess_status":'Completed',"assess_date":'2024-06',"wave":1,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-076',"name":'Anaplan FP&A',"domain":'Finance',"vendor":'Anaplan',"type":'Package',"status":'Active',"bcg":'Grow',"health":85,"tech_debt":13,"age":3,"tco":1100,"users":180,"criticality":'High',"dr":1,"eol":'2031-12',"pi_spi":0,"contract_end":'2027-06',"integration":8,"stack":'["Anaplan", "REST", "Excel"]',"capability":'Financial Planning',"strategic":82,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Anaplan Model',"os":'Cloud (SaaS)',"db_platform":'Anaplan DB',"support":'Vendor',"owner":'Amorn C.',"stream":'Core Finance',"approach":'Grow',"assess_status":'Planned',"assess_date":'2025-04',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-077',"name":'Verint Speech Analytics',"domain":'Customer',"vendor":'Verint',"type":'Package',"status":'Active',"bcg":'Grow',"health":78,"tech_debt":22,"age":3,"tco":760,"users":65,"criticality":'Medium',"dr":0,"eol":'2030-12',"pi_spi":0,"contract_end":'2027-03',"integration":7,"stack":'["Verint", "Python", "REST"]',"capability":'Voice Analytics',"strategic":76,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Python',"os":'Windows Server 2019',"db_platform":'SQL Server 2019',"support":'Vendor',"owner":'Narong P.',"stream":'Customer Experience',"approach":'Grow',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'2. Services',"ea_category":'2.1 Customer',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-078',"name":'Redis Cache Cluster',"domain":'Infrastructure',"vendor":'Redis Labs',"type":'Package',"status":'Active',"bcg":'Invest',"health":93,"tech_debt":5,"age":2,"tco":420,"users":0,"criticality":'High',"dr":1,"eol":'2033-12',"pi_spi":0,"contract_end":'2027-06',"integration":18,"stack":'["Redis", "Cluster", "Sentinel"]',"capability":'In-Memory Cache',"strategic":80,"persons":3,"src_avail":0,"service_hour":'24x7',"maint_window":'Thu 02:00-04:00',"lang":'Redis',"os":'Linux (K8s)',"db_platform":'Redis',"support":'Vendor+Inhouse',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-10',"wave":1,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-079',"name":'Mendix Low-Code',"domain":'Digital',"vendor":'Siemens',"type":'Package',"status":'Active',"bcg":'Grow',"health":82,"tech_debt":16,"age":2,"tco":680,"users":45,"criticality":'Low',"dr":0,"eol":'2032-06',"pi_spi":0,"contract_end":'2026-12',"integration":6,"stack":'["Mendix", "REST", "Java"]',"capability":'Low-Code Dev',"strategic":72,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Mendix',"os":'Cloud (SaaS)',"db_platform":'Mendix DB',"support":'Vendor+Inhouse',"owner":'Worapon S.',"stream":'Customer Experience',"approach":'Grow',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-080',"name":'IBM MQ Messaging',"domain":'Infrastructure',"vendor":'IBM',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":72,"tech_debt":30,"age":10,"tco":890,"users":0,"criticality":'Mission Critical',"dr":1,"eol":'2028-06',"pi_spi":0,"contract_end":'2028-06',"integration":42,"stack":'["IBM MQ", "Java", "AMQP"]',"capability":'Message Queuing',"strategic":65,"persons":3,"src_avail":0,"service_hour":'24x7',"maint_window":'Wed 02:00-04:00',"lang":'Java/C',"os":'AIX',"db_platform":'IBM MQ Store',"support":'Vendor+Inhouse',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Replace',"assess_status":'In Progress',"assess_date":'2024-11',"wave":2,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-081',"name":'Workiva GRC Report',"domain":'Finance',"vendor":'Workiva',"type":'Package',"status":'Active',"bcg":'Invest',"health":88,"tech_debt":10,"age":2,"tco":720,"users":85,"criticality":'High',"dr":1,"eol":'2033-06',"pi_spi":1,"contract_end":'2027-03',"integration":5,"stack":'["Workiva", "REST", "Excel"]',"capability":'Regulatory Reporting',"strategic":87,"persons":2,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Wdesk',"os":'Cloud (SaaS)',"db_platform":'Workiva DB',"support":'Vendor',"owner":'Amorn C.',"stream":'Core Finance',"approach":'Extend',"assess_status":'Planned',"assess_date":'2025-05',"wave":2,"ea_group":'5. Governance',"ea_category":'5.3 Law & Compliance',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-082',"name":'Kafka Event Bus',"domain":'Infrastructure',"vendor":'Confluent',"type":'Package',"status":'Active',"bcg":'Invest',"health":89,"tech_debt":9,"age":3,"tco":960,"users":0,"criticality":'Mission Critical',"dr":1,"eol":'2032-12',"pi_spi":0,"contract_end":'2027-06',"integration":38,"stack":'["Apache Kafka", "Confluent", "Java"]',"capability":'Event Streaming',"strategic":91,"persons":4,"src_avail":0,"service_hour":'24x7',"maint_window":'Thu 02:00-04:00',"lang":'Java/Scala',"os":'Linux (K8s)',"db_platform":'Kafka Topics',"support":'Vendor+Inhouse',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-09',"wave":1,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-083',"name":'NetSuite ERP SME',"domain":'Finance',"vendor":'Oracle',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":74,"tech_debt":27,"age":7,"tco":1400,"users":130,"criticality":'High',"dr":1,"eol":'2029-12',"pi_spi":0,"contract_end":'2026-12',"integration":10,"stack":'["NetSuite", "SuiteScript", "REST"]',"capability":'SME Finance',"strategic":58,"persons":2,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'SuiteScript',"os":'Cloud (SaaS)',"db_platform":'NetSuite DB',"support":'Vendor',"owner":'Amorn C.',"stream":'Core Finance',"approach":'Migrate',"assess_status":'Planned',"assess_date":'2025-06',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-084',"name":'Grafana Observability',"domain":'Infrastructure',"vendor":'Grafana Labs',"type":'Package',"status":'Active',"bcg":'Grow',"health":88,"tech_debt":10,"age":2,"tco":320,"users":45,"criticality":'High',"dr":1,"eol":'2032-12',"pi_spi":0,"contract_end":'2026-12',"integration":22,"stack":'["Grafana", "Prometheus", "Loki"]',"capability":'Observability',"strategic":82,"persons":3,"src_avail":0,"service_hour":'24x7',"maint_window":'Thu 02:00-04:00',"lang":'PromQL',"os":'Linux (K8s)',"db_platform":'Prometheus',"support":'Vendor+Inhouse',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Grow',"assess_status":'Not Started',"assess_date":'',"wave":2,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-085',"name":'Genesys Cloud CX',"domain":'Customer',"vendor":'Genesys',"type":'Package',"status":'Active',"bcg":'Invest',"health":86,"tech_debt":12,"age":3,"tco":2200,"users":380,"criticality":'High',"dr":1,"eol":'2031-12',"pi_spi":1,"contract_end":'2027-06',"integration":14,"stack":'["Genesys Cloud", "REST", "WebRTC"]',"capability":'Contact Centre',"strategic":88,"persons":5,"src_avail":0,"service_hour":'24x7',"maint_window":'Sun 02:00-06:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'Genesys DB',"support":'Vendor+Inhouse',"owner":'Narong P.',"stream":'Customer Experience',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-10',"wave":2,"ea_group":'2. Services',"ea_category":'2.1 Customer',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-086',"name":'Legacy COBOL Payroll',"domain":'HR',"vendor":'Internal',"type":'Inhouse',"status":'Phase-out',"bcg":'Retire',"health":32,"tech_debt":88,"age":25,"tco":3100,"users":8,"criticality":'Mission Critical',"dr":0,"eol":'2025-12',"pi_spi":1,"contract_end":'N/A',"integration":6,"stack":'["COBOL", "JCL", "VSAM"]',"capability":'Payroll Processing',"strategic":10,"persons":1,"src_avail":1,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'COBOL/JCL',"os":'IBM z/OS',"db_platform":'VSAM',"support":'Inhouse',"owner":'Wanchai S.',"stream":'HR Modernization',"approach":'Replace',"assess_status":'Completed',"assess_date":'2023-06',"wave":1,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-087',"name":'Cybersource Payment',"domain":'Customer',"vendor":'Visa',"type":'Package',"status":'Active',"bcg":'Invest',"health":92,"tech_debt":6,"age":4,"tco":880,"users":50000,"criticality":'Mission Critical',"dr":1,"eol":'2032-12',"pi_spi":1,"contract_end":'2028-03',"integration":12,"stack":'["Cybersource", "REST", "3DS"]',"capability":'Payment Processing',"strategic":95,"persons":3,"src_avail":0,"service_hour":'24x7',"maint_window":'Mon 03:00-05:00',"lang":'REST API',"os":'Cloud (SaaS)',"db_platform":'Cybersource DB',"support":'Vendor',"owner":'Narong P.',"stream":'Customer Experience',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-09',"wave":1,"ea_group":'2. Services',"ea_category":'2.1 Customer',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-088',"name":'SAS Risk Engine',"domain":'Analytics',"vendor":'SAS',"type":'Package',"status":'Active',"bcg":'Invest',"health":84,"tech_debt":14,"age":7,"tco":3600,"users":35,"criticality":'Mission Critical',"dr":1,"eol":'2030-06',"pi_spi":1,"contract_end":'2026-12',"integration":15,"stack":'["SAS", "Python", "R"]',"capability":'Risk Analytics',"strategic":91,"persons":5,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'SAS/Python',"os":'Linux',"db_platform":'SAS DB',"support":'Vendor+Inhouse',"owner":'Charoenporn V.',"stream":'Data & AI',"approach":'Modernize',"assess_status":'In Progress',"assess_date":'2024-12',"wave":2,"ea_group":'5. Governance',"ea_category":'5.2 Risk & Internal Control',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-089',"name":'SAP EWM',"domain":'Supply Chain',"vendor":'SAP',"type":'Package',"status":'Planned',"bcg":'Invest',"health":72,"tech_debt":20,"age":1,"tco":1800,"users":0,"criticality":'High',"dr":1,"eol":'2034-06',"pi_spi":0,"contract_end":'2030-06',"integration":9,"stack":'["SAP EWM", "ABAP", "HANA"]',"capability":'Warehouse Mgmt',"strategic":84,"persons":4,"src_avail":1,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'ABAP',"os":'SUSE Linux',"db_platform":'SAP HANA',"support":'Vendor+Inhouse',"owner":'Sirichai B.',"stream":'Supply Chain',"approach":'Build',"assess_status":'Not Started',"assess_date":'',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-090',"name":'Hashicorp Vault',"domain":'Security',"vendor":'HashiCorp',"type":'Package',"status":'Active',"bcg":'Invest',"health":91,"tech_debt":7,"age":2,"tco":480,"users":0,"criticality":'Mission Critical',"dr":1,"eol":'2033-12',"pi_spi":0,"contract_end":'2026-06',"integration":30,"stack":'["Vault", "Terraform", "REST"]',"capability":'Secrets Management',"strategic":93,"persons":3,"src_avail":0,"service_hour":'24x7',"maint_window":'Wed 02:00-04:00',"lang":'HCL/Go',"os":'Linux (K8s)',"db_platform":'Consul',"support":'Vendor+Inhouse',"owner":'Nuntachai P.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-08',"wave":1,"ea_group":'5. Governance',"ea_category":'5.1 Corporate Security & Policy',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-091',"name":'Camunda BPM Engine',"domain":'Operations',"vendor":'Camunda',"type":'Package',"status":'Active',"bcg":'Grow',"health":83,"tech_debt":15,"age":2,"tco":560,"users":120,"criticality":'Medium',"dr":0,"eol":'2032-06',"pi_spi":0,"contract_end":'2027-06',"integration":14,"stack":'["Camunda", "Java", "BPMN"]',"capability":'Workflow Engine',"strategic":77,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Java',"os":'Linux (K8s)',"db_platform":'PostgreSQL',"support":'Vendor+Inhouse',"owner":'Patipan W.',"stream":'Operations',"approach":'Grow',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'1. Direction',"ea_category":'1.6 Business Process & Services',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-092',"name":'Elastic Search',"domain":'Analytics',"vendor":'Elastic',"type":'Package',"status":'Active',"bcg":'Grow',"health":87,"tech_debt":11,"age":4,"tco":640,"users":25,"criticality":'High',"dr":1,"eol":'2031-12',"pi_spi":0,"contract_end":'2027-06',"integration":16,"stack":'["Elasticsearch", "Kibana", "Logstash"]',"capability":'Search & Analytics',"strategic":80,"persons":3,"src_avail":0,"service_hour":'24x7',"maint_window":'Thu 02:00-04:00',"lang":'REST/JSON',"os":'Linux (K8s)',"db_platform":'Elasticsearch',"support":'Vendor+Inhouse',"owner":'Charoenporn V.',"stream":'Data & AI',"approach":'Grow',"assess_status":'In Progress',"assess_date":'2025-01',"wave":2,"ea_group":'4. Support',"ea_category":'4.2 Corporate Information',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-093',"name":'Veeva CTMS',"domain":'Operations',"vendor":'Veeva',"type":'Package',"status":'Active',"bcg":'Invest',"health":85,"tech_debt":12,"age":3,"tco":1300,"users":90,"criticality":'High',"dr":1,"eol":'2032-06',"pi_spi":1,"contract_end":'2028-06',"integration":8,"stack":'["Veeva CTMS", "REST", "Java"]',"capability":'Clinical Trial Mgmt',"strategic":83,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'Java/JS',"os":'Cloud (SaaS)',"db_platform":'Veeva DB',"support":'Vendor',"owner":'Patipan W.',"stream":'Operations',"approach":'Extend',"assess_status":'Planned',"assess_date":'2025-04',"wave":2,"ea_group":'3. Core Products',"ea_category":'3.2 Corporate & Core System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-094',"name":'MuleSoft API Portal',"domain":'Digital',"vendor":'Salesforce',"type":'Package',"status":'Active',"bcg":'Grow',"health":84,"tech_debt":14,"age":3,"tco":780,"users":80,"criticality":'Medium',"dr":0,"eol":'2031-12',"pi_spi":0,"contract_end":'2027-06',"integration":22,"stack":'["MuleSoft", "REST", "OpenAPI"]',"capability":'API Management',"strategic":79,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'DataWeave',"os":'Cloud (SaaS)',"db_platform":'MySQL',"support":'Vendor+Inhouse',"owner":'Nuttapon T.',"stream":'Customer Experience',"approach":'Grow',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'2. Services',"ea_category":'2.2 Partner',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-095',"name":'SAP Concur Travel',"domain":'Finance',"vendor":'SAP',"type":'Package',"status":'Active',"bcg":'Tolerate',"health":77,"tech_debt":24,"age":6,"tco":680,"users":920,"criticality":'Low',"dr":0,"eol":'2029-12',"pi_spi":0,"contract_end":'2026-12',"integration":4,"stack":'["SAP Concur", "REST", "OAuth"]',"capability":'T&E Management',"strategic":52,"persons":1,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'JavaScript',"os":'Cloud (SaaS)',"db_platform":'Concur DB',"support":'Vendor',"owner":'Amorn C.',"stream":'Core Finance',"approach":'Extend',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'3. Core Products',"ea_category":'3.3 Back Office & Support System',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-096',"name":'Databricks Lakehouse',"domain":'Analytics',"vendor":'Databricks',"type":'Package',"status":'Active',"bcg":'Invest',"health":88,"tech_debt":10,"age":2,"tco":1800,"users":55,"criticality":'High',"dr":1,"eol":'2033-06',"pi_spi":0,"contract_end":'2027-06',"integration":14,"stack":'["Databricks", "Spark", "Delta Lake", "Python"]',"capability":'Data Lakehouse',"strategic":92,"persons":5,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'Python/SQL',"os":'Cloud (SaaS)',"db_platform":'Delta Lake',"support":'Vendor+Inhouse',"owner":'Charoenporn V.',"stream":'Data & AI',"approach":'Invest',"assess_status":'Completed',"assess_date":'2024-11',"wave":2,"ea_group":'4. Support',"ea_category":'4.2 Corporate Information',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-097',"name":'SAP Fiori Launchpad',"domain":'Digital',"vendor":'SAP',"type":'Package',"status":'Active',"bcg":'Invest',"health":86,"tech_debt":12,"age":4,"tco":480,"users":1200,"criticality":'High',"dr":1,"eol":'2031-06',"pi_spi":0,"contract_end":'2027-06',"integration":8,"stack":'["SAP Fiori", "UI5", "ABAP"]',"capability":'UX Platform',"strategic":82,"persons":3,"src_avail":1,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'ABAP/UI5',"os":'SUSE Linux',"db_platform":'SAP HANA',"support":'Vendor+Inhouse',"owner":'Somchai K.',"stream":'Core Finance',"approach":'Upgrade',"assess_status":'Planned',"assess_date":'2025-03',"wave":2,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-098',"name":'GitLab DevSecOps',"domain":'Infrastructure',"vendor":'GitLab',"type":'Package',"status":'Active',"bcg":'Invest',"health":90,"tech_debt":8,"age":3,"tco":560,"users":280,"criticality":'High',"dr":1,"eol":'2032-12',"pi_spi":0,"contract_end":'2027-06',"integration":18,"stack":'["GitLab", "Docker", "Kubernetes"]',"capability":'DevSecOps Platform',"strategic":86,"persons":4,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sat 22:00-02:00',"lang":'YAML/Ruby',"os":'Linux (K8s)',"db_platform":'PostgreSQL',"support":'Vendor+Inhouse',"owner":'Nuttapon T.',"stream":'Platform Modernization',"approach":'Invest',"assess_status":'In Progress',"assess_date":'2025-01',"wave":1,"ea_group":'4. Support',"ea_category":'4.3 Corporate Application & Information Technology',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-099',"name":'Archer Risk Platform',"domain":'Security',"vendor":'RSA',"type":'Package',"status":'Active',"bcg":'Invest',"health":82,"tech_debt":16,"age":5,"tco":1200,"users":95,"criticality":'High',"dr":1,"eol":'2030-12',"pi_spi":1,"contract_end":'2027-12',"integration":12,"stack":'["Archer", "Java", "REST"]',"capability":'Risk Management',"strategic":88,"persons":3,"src_avail":0,"service_hour":'Business Hours',"maint_window":'Sun 02:00-06:00',"lang":'Java',"os":'Windows Server 2019',"db_platform":'SQL Server 2019',"support":'Vendor+Inhouse',"owner":'Nuntachai P.',"stream":'Platform Modernization',"approach":'Modernize',"assess_status":'Planned',"assess_date":'2025-04',"wave":2,"ea_group":'5. Governance',"ea_category":'5.2 Risk & Internal Control',"ea_sub_category":'-',"last_updated":'2025-01-01'},
-        {"id":'APP-100',"name":'Digital Twin Platform',"domain":'Digital',"vendor":'Internal',"type":'Inhouse',"status":'Planned',"bcg":'Grow',"health":65,"tech_debt":30,"age":0,"tco":880,"users":0,"criticality":'Medium',"dr":0,"eol":'2033-12',"pi_spi":0,"contract_end":'N/A',"integration":8,"stack":'["Python", "IoT", "Azure Digital Twins", "React"]',"capability":'Digital Twin',"strategic":90,"persons":5,"src_avail":1,"service_hour":'Business Hours',"maint_window":'N/A',"lang":'Python',"os":'Azure Cloud',"db_platform":'Azure CosmosDB',"support":'Inhouse',"owner":'Thanakrit W.',"stream":'Data & AI',"approach":'Build',"assess_status":'Not Started',"assess_date":'',"wave":3,"ea_group":'4. Support',"ea_category":'4.2 Corporate Information',"ea_sub_category":'-',"last_updated":'2025-01-01'}
-    ]
+    """Seed application catalog — kept in seed_apps.json next to server.py rather than as a module literal."""
+    with open(SEED_APPS_PATH, "rb") as f:
+        return _json_loads(f.read())
 
 # ─── STARTUP (FastAPI lifecycle) ───────────────────────────────────────────────
 app.add_middleware(OperationLogMiddleware)
@@ -8113,17 +8810,29 @@ def _on_startup():
     threading.Thread(target=_nvd_daily_refresh, daemon=True).start()
 
 # ─── ENTRY POINT ───────────────────────────────────────────────────────────────
-if __name__ == "__main__":
+def main() -> None:
+    """`python server.py` — banner + uvicorn. Schema/seed run in the startup hook, so plain
+    `uvicorn server:app` (Procfile, railway.json) and every worker get the same init."""
     import uvicorn
-    print(f"\n{'='*55}")
-    print(f"  {APP_NAME} EA Portfolio {APP_VERSION}")
-    print(f"{'='*55}")
-    print(f"  Config   : {_CONFIG_PATH}")
-    print(f"  Frontend : http://localhost:{PORT}/")
-    print(f"  API Docs : http://localhost:{PORT}/docs")
-    print(f"  Database : {os.path.abspath(DB_PATH)}")
-    print(f"  Audit DB : {os.path.abspath(AUDIT_DB_PATH)}")
-    print(f"{'='*55}\n")
-    # Railway: reload=False in production; use $PORT from environment
-    reload_mode = os.environ.get("APP_ENV", "development") == "development"
-    uvicorn.run("server:app", host="0.0.0.0", port=PORT, reload=reload_mode, reload_excludes=["*.db"])
+    rule = "=" * 55
+    sys.stdout.write("\n".join((
+        "", rule,
+        f"  {APP_NAME} EA Portfolio {APP_VERSION}",
+        rule,
+        f"  Config   : {_CONFIG_PATH}",
+        f"  Frontend : http://localhost:{PORT}/",
+        f"  API Docs : http://localhost:{PORT}/docs",
+        f"  Database : {DB_ABS_PATH}",
+        f"  Audit DB : {AUDIT_DB_PATH}",
+        rule, "", "",
+    )))
+    sys.stdout.flush()
+    # reload เฉพาะตอน dev (DEV_RELOAD=1) — watcher จะ import server ซ้ำอีกรอบและบังคับ worker เดียว
+    # WORKERS > 1 ใช้ได้ แต่ token blacklist / login lockout อยู่ใน memory ของแต่ละ process
+    reload_mode = os.environ.get("DEV_RELOAD") == "1"
+    workers = 1 if reload_mode else max(1, int(os.environ.get("WORKERS", "1")))
+    uvicorn.run("server:app", host="0.0.0.0", port=PORT, reload=reload_mode, workers=workers,
+                reload_excludes=["*.db", "*.db-wal", "*.db-shm"])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Each test gets its own copy of server.py in a temp dir, so the SQLite files it creates (and seeds
+from seed_apps.json) never touch the databases committed next to the real server.py."""
+import importlib.util
+import os
+import shutil
+import sys
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_FILES = ("server.py", "seed_apps.json", "mpx-studio.config.json", "users.config.json")
+
+
+@pytest.fixture
+def srv(tmp_path):
+    for name in _FILES:
+        shutil.copy(os.path.join(ROOT, name), tmp_path / name)
+    os.symlink(os.path.join(ROOT, "static"), tmp_path / "static")
+    mod_name = f"server_under_test_{id(tmp_path)}"
+    spec = importlib.util.spec_from_file_location(mod_name, tmp_path / "server.py")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[mod_name] = mod
+    spec.loader.exec_module(mod)
+    yield mod
+    sys.modules.pop(mod_name, None)
+
+
+@pytest.fixture
+def client(srv):
+    token = srv._create_jwt({"sub": "admin", "username": "admin", "roles": ["admin"],
+                             "exp": int(time.time()) + 3600})
+    with TestClient(srv.app) as c:
+        c.headers["Authorization"] = f"Bearer {token}"
+        yield c
@@ -0,0 +1,101 @@
+import sqlite3
+
+
+def _ea_count(structure, group, category):
+    return next(g["counts"][category] for g in structure if g["group"] == group)
+
+
+def test_ea_structure_sees_writes_from_other_workers(srv, client):
+    before = client.get("/api/ea/structure").json()
+    group, category = "1. Direction", "1.1 BOD"
+    # another worker process: writes straight to SQLite, so this process's _bust_cache never runs
+    with sqlite3.connect(srv.DB_PATH) as conn:
+        conn.execute("UPDATE applications SET ea_group=?, ea_category=? WHERE id='APP-001'", (group, category))
+    after = client.get("/api/ea/structure").json()
+    assert _ea_count(after, group, category) == _ea_count(before, group, category) + 1
+
+
+def _import(client, apps):
+    r = client.post("/api/import", json={"mode": "upsert", "apps": apps})
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_import_counts_out_of_range_row_and_keeps_the_rest(client):
+    apps = [{"id": "APP-901", "name": "Good A"}, {"id": "APP-902", "name": "Too big", "tco": 10**20},
+            {"id": "APP-903", "name": "Good B"}]
+    res = _import(client, apps)
+    assert (res["added"], res["updated"], res["errors"]) == (2, 0, 1)
+    assert client.get("/api/apps/APP-901").status_code == 200
+    assert client.get("/api/apps/APP-902").status_code == 404
+    assert client.get("/api/apps/APP-903").status_code == 200
+
+
+def test_import_falls_back_per_row_when_sqlite_rejects_one(srv, client):
+    with sqlite3.connect(srv.DB_PATH) as conn:
+        conn.execute("""CREATE TRIGGER reject_bad BEFORE INSERT ON applications WHEN NEW.id='APP-912'
+                        BEGIN SELECT RAISE(ABORT, 'rejected'); END""")
+    apps = [{"id": "APP-911", "name": "Good A"}, {"id": "APP-912", "name": "Rejected"},
+            {"id": "APP-001", "name": "Renamed"}]
+    res = _import(client, apps)
+    assert (res["added"], res["updated"], res["errors"]) == (1, 1, 1)
+    assert client.get("/api/apps/APP-911").status_code == 200
+    assert client.get("/api/apps/APP-912").status_code == 404
+    assert client.get("/api/apps/APP-001").json()["name"] == "Renamed"
+
+
+def test_accept_encoding_q0_refuses_coding(client):
+    def coding(path, accept):
+        r = client.get(path, headers={"Accept-Encoding": accept})
+        assert r.status_code == 200
+        return r.headers.get("content-encoding")
+    assert coding("/api/apps", "gzip") == "gzip"
+    assert coding("/api/apps", "gzip;q=0") is None
+    assert coding("/api/apps", "br;q=0, gzip") == "gzip"
+    assert coding("/api/apps", "identity;q=1, gzip;q=0.5") is None
+    assert coding("/api/apps", "xgzipx") is None
+    # responses compressed by the middleware rather than the catalog encoder
+    assert coding("/openapi.json", "gzip") == "gzip"
+    assert coding("/openapi.json", "gzip;q=0") is None
+
+
+def test_negotiate_coding_br(srv):
+    offered = ["br", "gzip"]
+    assert srv._negotiate_coding("br, gzip", offered) == "br"
+    assert srv._negotiate_coding("br;q=0, gzip", offered) == "gzip"
+    assert srv._negotiate_coding("gzip;q=0.5, br;q=0.8", offered) == "br"
+    assert srv._negotiate_coding("*;q=0", offered) is None
+    assert srv._negotiate_coding("abrc", offered) is None
+
+
+def test_index_gzip_is_compressed_once(srv, client, monkeypatch):
+    calls = []
+    real = srv.gzip.compress
+    monkeypatch.setattr(srv.gzip, "compress", lambda *a, **k: calls.append(1) or real(*a, **k))
+    with open(srv.os.path.join(srv.STATIC_DIR, "index.html"), "rb") as f:
+        html = f.read()
+    for _ in range(3):
+        r = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert r.headers["content-encoding"] == "gzip" and r.content == html
+    assert len(calls) == 1
+    r = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in r.headers and r.content == html
+
+
+def test_month_bounds_reject_out_of_range_months(srv, client):
+    assert srv.ym_key("2024-12") == 202412 and srv.ym_key("2024-01-31") == 202401
+    for bad in ("2024-13", "2024-00", "2024-1", "2024-05x", " 2024-05"):
+        assert srv.ym_key(bad) == -1
+        assert client.get("/api/apps", params={"eol_from": bad}).status_code == 400
+        assert client.get("/api/apps", params={"contract_end_before": bad}).status_code == 400
+    assert client.get("/api/apps", params={"eol_from": "2024-01", "eol_before": "2030-12"}).status_code == 200
+
+
+def test_apps_paging_covers_more_apps_than_the_limit(client):
+    _import(client, [{"id": f"APP-{n}", "name": f"Bulk {n}"} for n in range(1000, 1150)])
+    every = [a["id"] for a in client.get("/api/apps").json()]
+    assert len(every) > 200 and "APP-1149" in every
+    pages = [client.get("/api/apps", params={"offset": off, "limit": 200}).json() for off in (0, 200)]
+    assert len(pages[0]) == 200
+    assert [a["id"] for page in pages for a in page] == every
+    assert client.get("/api/apps", params={"offset": len(every), "limit": 200}).json() == []